@@ -1,3 +1,4 @@
+import asyncio
 import os
 import re
 import time
@@ -30,6 +31,13 @@ OUTPUT_DIR = Path("./output")
 OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 app.mount("/videos", StaticFiles(directory=str(OUTPUT_DIR)), name="videos")
 
+# Cap concurrent generations: each one spawns its own ffmpeg processes,
+# so more than a few in flight just thrash CPU and disk
+GENERATION_SEMAPHORE = asyncio.Semaphore(4)
+
+# Compiled once; matches words while preserving contractions (don't, isn't)
+WORD_RE = re.compile(r"\b[\w']+\b")
+
 class SearchResponseItem(BaseModel):
     id: int
     video_id: str
@@ -112,14 +120,28 @@ class GenerateVideoResponse(BaseModel):
     word_timings: Optional[List[WordTiming]] = None
 
 
+def _run_generation(config: StitchingConfig, text: str, output_filename: str):
+    """Run one blocking video generation (executed in a worker thread)."""
+    with VideoStitcher(config) as stitcher:
+        # The video stitcher will handle word lookup and stitching
+        return stitcher.generate_video(
+            text=text,
+            output_filename=output_filename
+        )
+
+
 @app.post("/generate-video", response_model=GenerateVideoResponse)
-def generate_video(request: GenerateVideoRequest):
+async def generate_video(request: GenerateVideoRequest):
     """
     Generate a video by stitching together clips of individual words.
-    
+
+    Generations run in worker threads behind a semaphore so concurrent
+    requests overlap without blocking the event loop or oversubscribing
+    ffmpeg.
+
     Args:
         request: GenerateVideoRequest with text and optional lang
-        
+
     Returns:
         GenerateVideoResponse with video URL or error message
     """
@@ -128,7 +150,7 @@ def generate_video(request: GenerateVideoRequest):
         raise HTTPException(400, detail="text is required")
     
     # Parse text into words (preserve contractions like don't, isn't)
-    words = re.findall(r"\b[\w']+\b", text.lower())
+    words = WORD_RE.findall(text.lower())
     # Filter out standalone apostrophes
     words = [w for w in words if w and w != "'"]
     if not words:
@@ -172,12 +194,10 @@ def generate_video(request: GenerateVideoRequest):
         timestamp = int(time.time())
         output_filename = f"generated_{timestamp}.mp4"
         
-        # Generate the video
-        with VideoStitcher(config) as stitcher:
-            # The video stitcher will handle word lookup and stitching
-            output_path, word_timings = stitcher.generate_video(
-                text=text,
-                output_filename=output_filename
+        # Generate the video off the event loop, bounded by the semaphore
+        async with GENERATION_SEMAPHORE:
+            output_path, word_timings = await asyncio.to_thread(
+                _run_generation, config, text, output_filename
             )
         
         # Return the video URL and word timings
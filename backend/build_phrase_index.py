@@ -15,6 +15,7 @@ import sqlite3
 import json
 import hashlib
 import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import List, Tuple
 
@@ -58,6 +59,33 @@ def extract_phrases(transcript: List[List], phrase_length: int) -> List[Tuple[st
     return phrases
 
 
+def _extract_video_phrases(args: Tuple[str, str, Tuple[int, ...]]) -> List[Tuple]:
+    """Build phrase_index rows for one video (process pool worker).
+
+    Args:
+        args: (video_id, transcript_data JSON, phrase_lengths) tuple —
+            packed so the function is picklable for ProcessPoolExecutor.
+
+    Returns:
+        List of phrase_index row tuples for this video.
+    """
+    video_id, transcript_data, phrase_lengths = args
+    transcript = json.loads(transcript_data)
+
+    rows = []
+    for phrase_length in phrase_lengths:
+        for phrase_text, start, end in extract_phrases(transcript, phrase_length):
+            rows.append((
+                phrase_hash(phrase_text),
+                phrase_text,
+                video_id,
+                start,
+                end,
+                phrase_length
+            ))
+    return rows
+
+
 def build_phrase_index(db_path: str, phrase_lengths: List[int] = [2, 3, 4, 5], batch_size: int = 1000):
     """Build phrase index from all video transcripts.
     
@@ -73,7 +101,13 @@ def build_phrase_index(db_path: str, phrase_lengths: List[int] = [2, 3, 4, 5], b
     conn = sqlite3.connect(db_path)
     conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
-    
+
+    # WAL with relaxed sync: committing every batch on the default
+    # journal mode fsyncs the whole database once per 1000 phrases
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+
     # Check if phrase_index table exists
     cursor.execute("""
         SELECT name FROM sqlite_master 
@@ -85,10 +119,13 @@ def build_phrase_index(db_path: str, phrase_lengths: List[int] = [2, 3, 4, 5], b
         conn.close()
         return
     
+    # One transaction wraps the clear and the whole rebuild; a crash
+    # mid-build leaves the old index intact instead of a partial one
+    cursor.execute("BEGIN IMMEDIATE")
+
     # Clear existing data (in case we're rebuilding)
     print("🗑️  Clearing existing phrase index...")
     cursor.execute("DELETE FROM phrase_index")
-    conn.commit()
     
     # Get total number of transcripts
     cursor.execute("SELECT COUNT(*) as count FROM video_transcripts")
@@ -110,58 +147,50 @@ def build_phrase_index(db_path: str, phrase_lengths: List[int] = [2, 3, 4, 5], b
     processed_videos = 0
     start_time = time.time()
     
-    for row in cursor.fetchall():
-        video_id = row['video_id']
-        transcript = json.loads(row['transcript_data'])
-        
-        # Extract phrases of each length
-        for phrase_length in phrase_lengths:
-            phrases = extract_phrases(transcript, phrase_length)
-            
-            for phrase_text, start, end in phrases:
-                # Generate hash for fast lookup
-                p_hash = phrase_hash(phrase_text)
-                
-                batch.append((
-                    p_hash,
-                    phrase_text,
-                    video_id,
-                    start,
-                    end,
-                    phrase_length
-                ))
-                total_phrases += 1
-            
+    # JSON decode + phrase extraction + hashing is CPU-bound and
+    # independent per video, so fan it out across cores; all SQLite
+    # writes stay on this thread
+    work = (
+        (row['video_id'], row['transcript_data'], tuple(phrase_lengths))
+        for row in cursor.fetchall()
+    )
+
+    with ProcessPoolExecutor() as pool:
+        for rows in pool.map(_extract_video_phrases, work, chunksize=16):
+            batch.extend(rows)
+            total_phrases += len(rows)
+
             # Insert batch
             if len(batch) >= batch_size:
                 cursor.executemany("""
-                    INSERT OR IGNORE INTO phrase_index 
+                    INSERT OR IGNORE INTO phrase_index
                     (phrase_hash, phrase_text, video_id, start_time, end_time, word_count)
                     VALUES (?, ?, ?, ?, ?, ?)
                 """, batch)
-                conn.commit()
                 batch = []
-        
-        processed_videos += 1
-        
-        # Progress update every 100 videos
-        if processed_videos % 100 == 0:
-            elapsed = time.time() - start_time
-            rate = processed_videos / elapsed
-            eta = (total_videos - processed_videos) / rate if rate > 0 else 0
-            print(f"   Progress: {processed_videos}/{total_videos} videos "
-                  f"({processed_videos/total_videos*100:.1f}%) - "
-                  f"{total_phrases:,} phrases - "
-                  f"ETA: {eta/60:.1f}m")
+
+            processed_videos += 1
+
+            # Progress update every 100 videos
+            if processed_videos % 100 == 0:
+                elapsed = time.time() - start_time
+                rate = processed_videos / elapsed
+                eta = (total_videos - processed_videos) / rate if rate > 0 else 0
+                print(f"   Progress: {processed_videos}/{total_videos} videos "
+                      f"({processed_videos/total_videos*100:.1f}%) - "
+                      f"{total_phrases:,} phrases - "
+                      f"ETA: {eta/60:.1f}m")
     
     # Insert remaining batch
     if batch:
         cursor.executemany("""
-            INSERT OR IGNORE INTO phrase_index 
+            INSERT OR IGNORE INTO phrase_index
             (phrase_hash, phrase_text, video_id, start_time, end_time, word_count)
             VALUES (?, ?, ?, ?, ?, ?)
         """, batch)
-        conn.commit()
+
+    # Single commit for the whole rebuild
+    conn.commit()
     
     # Get final statistics
     cursor.execute("SELECT COUNT(*) as count FROM phrase_index")
@@ -5,6 +5,31 @@ create_test_db.py - Creates a small test database for development and testing
 import sqlite3
 from pathlib import Path
 
+# Sample data with real YouTube video IDs; module-level tuple so repeated
+# calls reuse the same immutable rows
+# Note: These are well-known public videos that should be available
+TEST_DATA = (
+    # Using "Me at the zoo" - first YouTube video (jNQXAC9IVRw)
+    ("hello", "jNQXAC9IVRw", 5.0, 1.5),
+    ("world", "jNQXAC9IVRw", 10.0, 1.2),
+    ("test", "jNQXAC9IVRw", 3.0, 1.0),
+
+    # Using PSY - GANGNAM STYLE (9bZkp7q19f0)
+    ("this", "9bZkp7q19f0", 20.0, 0.8),
+    ("is", "9bZkp7q19f0", 25.0, 0.7),
+    ("video", "9bZkp7q19f0", 30.0, 1.5),
+
+    # Using popular educational content
+    ("python", "kqtD5dpn9C8", 5.0, 1.3),
+    ("code", "kqtD5dpn9C8", 10.0, 1.1),
+    ("programming", "kqtD5dpn9C8", 15.0, 2.0),
+
+    # More words for testing
+    ("data", "jNQXAC9IVRw", 8.0, 0.9),
+    ("structure", "9bZkp7q19f0", 35.0, 1.2),
+    ("algorithm", "kqtD5dpn9C8", 20.0, 1.8),
+)
+
 def create_test_database(db_path: str = "test_words.db"):
     """Create a test database with sample word-to-clip mappings."""
     
@@ -17,7 +42,14 @@ def create_test_database(db_path: str = "test_words.db"):
     # Create database
     conn = sqlite3.connect(db_path)
     cursor = conn.cursor()
-    
+
+    # WAL with relaxed sync avoids an fsync per statement; one explicit
+    # transaction wraps the whole build
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("BEGIN")
+
     # Create table
     cursor.execute("""
         CREATE TABLE word_clips (
@@ -28,48 +60,25 @@ def create_test_database(db_path: str = "test_words.db"):
         )
     """)
     
-    # Sample data with real YouTube video IDs
-    # Note: These are well-known public videos that should be available
-    test_data = [
-        # Using "Me at the zoo" - first YouTube video (jNQXAC9IVRw)
-        ("hello", "jNQXAC9IVRw", 5.0, 1.5),
-        ("world", "jNQXAC9IVRw", 10.0, 1.2),
-        ("test", "jNQXAC9IVRw", 3.0, 1.0),
-        
-        # Using PSY - GANGNAM STYLE (9bZkp7q19f0)
-        ("this", "9bZkp7q19f0", 20.0, 0.8),
-        ("is", "9bZkp7q19f0", 25.0, 0.7),
-        ("video", "9bZkp7q19f0", 30.0, 1.5),
-        
-        # Using popular educational content
-        ("python", "kqtD5dpn9C8", 5.0, 1.3),
-        ("code", "kqtD5dpn9C8", 10.0, 1.1),
-        ("programming", "kqtD5dpn9C8", 15.0, 2.0),
-        
-        # More words for testing
-        ("data", "jNQXAC9IVRw", 8.0, 0.9),
-        ("structure", "9bZkp7q19f0", 35.0, 1.2),
-        ("algorithm", "kqtD5dpn9C8", 20.0, 1.8),
-    ]
-    
     # Insert test data
     cursor.executemany("""
         INSERT INTO word_clips (word, video_id, start_time, duration)
         VALUES (?, ?, ?, ?)
-    """, test_data)
-    
+    """, TEST_DATA)
+
+    # Index video_id so per-video grouping and DISTINCT counts use an
+    # index scan; ANALYZE gives the planner the stats to pick it
+    cursor.execute("CREATE INDEX idx_word_clips_video ON word_clips(video_id)")
+    cursor.execute("ANALYZE")
+
     conn.commit()
-    
-    # Print statistics
-    cursor.execute("SELECT COUNT(*) FROM word_clips")
-    word_count = cursor.fetchone()[0]
-    
-    cursor.execute("SELECT COUNT(DISTINCT video_id) FROM word_clips")
-    video_count = cursor.fetchone()[0]
-    
-    cursor.execute("SELECT AVG(duration) FROM word_clips")
-    avg_duration = cursor.fetchone()[0]
-    
+
+    # Print statistics (single aggregate query instead of three scans)
+    cursor.execute(
+        "SELECT COUNT(*), COUNT(DISTINCT video_id), AVG(duration) FROM word_clips"
+    )
+    word_count, video_count, avg_duration = cursor.fetchone()
+
     conn.close()
     
     print(f"\n{'='*60}")
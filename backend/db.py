@@ -1,14 +1,27 @@
 import os
 import sqlite3
+import threading
 from typing import List, Dict
 
 DB_PATH = os.getenv("DB_PATH", "./data/youglish.db")
 
+# One connection per thread: connect/teardown per query costs more than
+# the query itself on this read-mostly workload
+_local = threading.local()
 
 
 def get_conn():
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        conn = sqlite3.connect(DB_PATH)
+        conn.row_factory = sqlite3.Row
+        # WAL allows concurrent readers; relaxed sync and a larger page
+        # cache plus mmap cut per-query I/O overhead
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA cache_size=-8000")
+        conn.execute("PRAGMA mmap_size=268435456")
+        _local.conn = conn
     return conn
 
 
@@ -29,7 +42,9 @@ def search_phrase(q: str, lang: str = None, limit: int = 20, channel_id: str = N
     if channel_id:
         sql += " AND v.channel_id = ?"
         params.append(channel_id)
-    sql += " ORDER BY s.t_start LIMIT ?"
+    # rank is FTS5's bm25 score: best matches first so LIMIT stops the
+    # walk early; t_start keeps ordering stable within equal scores
+    sql += " ORDER BY f.rank, s.t_start LIMIT ?"
     params.append(int(limit))
 
     with get_conn() as c:
@@ -8,15 +8,48 @@ It also builds the phrase_index for fast phrase lookups (2-5 word phrases).
 """
 
 import json
+import os
 import sqlite3
 import sys
 import hashlib
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, Iterator, List, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 DB_PATH = "./data/youglish.db"
 JSONL_PATH = "./data/live_whisperx_526k_with_seeks.jsonl"
 
+# Read the JSONL in fixed-size chunks; per-line readline() calls are a
+# measurable cost on a multi-GB file
+_CHUNK_SIZE = 1 << 20
+
+
+def iter_jsonl_lines(path: str) -> Iterator[bytes]:
+    """Yield raw JSONL lines as bytes from fixed-size chunked reads.
+
+    Args:
+        path: Path to the JSONL file.
+
+    Yields:
+        One line per entry (without the trailing newline); may be empty
+        for blank lines.
+    """
+    tail = b""
+    with open(path, 'rb') as f:
+        while True:
+            chunk = f.read(_CHUNK_SIZE)
+            if not chunk:
+                break
+            lines = (tail + chunk).split(b"\n")
+            tail = lines.pop()
+            yield from lines
+    if tail:
+        yield tail
+
 
 def parse_text_stream(text_stream: List[List]) -> List[Tuple[str, float, float]]:
     """
@@ -80,7 +113,36 @@ def ingest_jsonl(jsonl_path: str, db_path: str, batch_size: int = 1000):
     print(f"Opening database: {db_path}")
     conn = sqlite3.connect(db_path)
     cursor = conn.cursor()
-    
+
+    # WAL with relaxed sync avoids an fsync per auto-committed statement;
+    # the whole ingest then runs inside one explicit transaction
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("BEGIN IMMEDIATE")
+
+    # Track which source file built this database so unchanged re-runs
+    # skip the multi-GB parse entirely
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS ingest_meta (
+            source_path TEXT PRIMARY KEY,
+            mtime REAL NOT NULL,
+            size INTEGER NOT NULL
+        )
+    """)
+
+    src_stat = os.stat(jsonl_path)
+    cursor.execute(
+        "SELECT mtime, size FROM ingest_meta WHERE source_path = ?",
+        (jsonl_path,)
+    )
+    meta = cursor.fetchone()
+    if meta and meta[0] == src_stat.st_mtime and meta[1] == src_stat.st_size:
+        conn.commit()
+        conn.close()
+        print(f"Source unchanged since last ingest, skipping: {jsonl_path}")
+        return
+
     # Create word_clips table (for backward compatibility)
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS word_clips (
@@ -126,128 +188,136 @@ def ingest_jsonl(jsonl_path: str, db_path: str, batch_size: int = 1000):
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_phrase_video ON phrase_index(video_id)")
     
     print(f"Reading JSONL file: {jsonl_path}")
-    
+
     total_words = 0
     total_entries = 0
     total_transcripts = 0
     total_phrases = 0
     batch = []
     phrase_batch = []
-    
-    with open(jsonl_path, 'r', encoding='utf-8') as f:
-        for line_num, line in enumerate(f, 1):
-            line = line.strip()
-            if not line:
+
+    # orjson parses large records several times faster than stdlib json;
+    # both accept the raw bytes from the chunked reader
+    loads = orjson.loads if orjson is not None else json.loads
+
+    for line_num, line in enumerate(iter_jsonl_lines(jsonl_path), 1):
+        line = line.strip()
+        if not line:
+            continue
+
+        try:
+            # The file format has conversation entries
+            data = loads(line)
+            
+            # Skip the last line which contains seek indices
+            if isinstance(data, bytes) or (isinstance(data, str) and data.startswith('[')):
+                print(f"Skipping seek indices line")
                 continue
             
-            try:
-                # The file format has conversation entries
-                data = json.loads(line)
-                
-                # Skip the last line which contains seek indices
-                if isinstance(data, bytes) or (isinstance(data, str) and data.startswith('[')):
-                    print(f"Skipping seek indices line")
-                    continue
+            # Extract video info from the first user message
+            if isinstance(data, list) and len(data) >= 2:
+                user_msg = data[0]
+                assistant_msg = data[1]
                 
-                # Extract video info from the first user message
-                if isinstance(data, list) and len(data) >= 2:
-                    user_msg = data[0]
-                    assistant_msg = data[1]
+                # Get video_id from user content
+                if 'content' in user_msg and isinstance(user_msg['content'], list):
+                    video_info = None
+                    for item in user_msg['content']:
+                        if isinstance(item, dict) and item.get('type') == 'video':
+                            video_info = item
+                            break
                     
-                    # Get video_id from user content
-                    if 'content' in user_msg and isinstance(user_msg['content'], list):
-                        video_info = None
-                        for item in user_msg['content']:
-                            if isinstance(item, dict) and item.get('type') == 'video':
-                                video_info = item
-                                break
-                        
-                        if not video_info:
-                            continue
-                        
-                        video_id = extract_video_id(video_info['video'])
-                        
-                        # Get text_stream from assistant content
-                        if 'content' in assistant_msg and isinstance(assistant_msg['content'], list):
-                            for item in assistant_msg['content']:
-                                if isinstance(item, dict) and item.get('type') == 'text_stream':
-                                    text_stream = item.get('text_stream', [])
-                                    
-                                    # Parse words from text_stream
-                                    words = parse_text_stream(text_stream)
-                                    
-                                    # Store individual words (for backward compatibility)
-                                    for word, start_time, duration in words:
-                                        batch.append((word, video_id, start_time, duration))
-                                        total_words += 1
-                                    
-                                    # Store complete transcript for phrase matching
-                                    if words:
-                                        # Store as JSON: [[word, start_time, end_time], ...]
-                                        transcript_json = json.dumps([
-                                            [w, st, st + dur] for w, st, dur in words
-                                        ])
-                                        duration = words[-1][1] + words[-1][2] if words else 0
-                                        
-                                        cursor.execute("""
-                                            INSERT OR REPLACE INTO video_transcripts 
-                                            (video_id, transcript_data, word_count, duration)
-                                            VALUES (?, ?, ?, ?)
-                                        """, (video_id, transcript_json, len(words), duration))
-                                        total_transcripts += 1
-                                        
-                                        # Extract phrases for phrase_index (2-5 word phrases)
-                                        phrases = extract_phrases_from_words(words, video_id)
-                                        phrase_batch.extend(phrases)
-                                        total_phrases += len(phrases)
-                                    
-                                    break
+                    if not video_info:
+                        continue
                     
-                    total_entries += 1
+                    video_id = extract_video_id(video_info['video'])
                     
-                    # Insert batch
-                    if len(batch) >= batch_size:
-                        cursor.executemany(
-                            "INSERT OR IGNORE INTO word_clips (word, video_id, start_time, duration) VALUES (?, ?, ?, ?)",
-                            batch
-                        )
-                        conn.commit()
-                        print(f"Processed {total_entries} entries, {total_words} words, {total_transcripts} transcripts, {total_phrases} phrases...")
-                        batch = []
-                    
-                    # Insert phrase batch
-                    if len(phrase_batch) >= batch_size:
-                        cursor.executemany("""
-                            INSERT OR IGNORE INTO phrase_index 
-                            (phrase_hash, phrase_text, video_id, start_time, end_time, word_count)
-                            VALUES (?, ?, ?, ?, ?, ?)
-                        """, phrase_batch)
-                        conn.commit()
-                        phrase_batch = []
-            
-            except json.JSONDecodeError as e:
-                print(f"Error parsing line {line_num}: {e}")
-                continue
-            except Exception as e:
-                print(f"Error processing line {line_num}: {e}")
-                continue
-    
+                    # Get text_stream from assistant content
+                    if 'content' in assistant_msg and isinstance(assistant_msg['content'], list):
+                        for item in assistant_msg['content']:
+                            if isinstance(item, dict) and item.get('type') == 'text_stream':
+                                text_stream = item.get('text_stream', [])
+                                
+                                # Parse words from text_stream
+                                words = parse_text_stream(text_stream)
+                                
+                                # Store individual words (for backward compatibility)
+                                for word, start_time, duration in words:
+                                    batch.append((word, video_id, start_time, duration))
+                                    total_words += 1
+                                
+                                # Store complete transcript for phrase matching
+                                if words:
+                                    # Store as JSON: [[word, start_time, end_time], ...]
+                                    transcript_json = json.dumps([
+                                        [w, st, st + dur] for w, st, dur in words
+                                    ])
+                                    duration = words[-1][1] + words[-1][2] if words else 0
+                                    
+                                    cursor.execute("""
+                                        INSERT OR REPLACE INTO video_transcripts 
+                                        (video_id, transcript_data, word_count, duration)
+                                        VALUES (?, ?, ?, ?)
+                                    """, (video_id, transcript_json, len(words), duration))
+                                    total_transcripts += 1
+                                    
+                                    # Extract phrases for phrase_index (2-5 word phrases)
+                                    phrases = extract_phrases_from_words(words, video_id)
+                                    phrase_batch.extend(phrases)
+                                    total_phrases += len(phrases)
+                                
+                                break
+                
+                total_entries += 1
+                
+                # Insert batch
+                if len(batch) >= batch_size:
+                    cursor.executemany(
+                        "INSERT OR IGNORE INTO word_clips (word, video_id, start_time, duration) VALUES (?, ?, ?, ?)",
+                        batch
+                    )
+                    print(f"Processed {total_entries} entries, {total_words} words, {total_transcripts} transcripts, {total_phrases} phrases...")
+                    batch = []
+                
+                # Insert phrase batch
+                if len(phrase_batch) >= batch_size:
+                    cursor.executemany("""
+                        INSERT OR IGNORE INTO phrase_index 
+                        (phrase_hash, phrase_text, video_id, start_time, end_time, word_count)
+                        VALUES (?, ?, ?, ?, ?, ?)
+                    """, phrase_batch)
+                    phrase_batch = []
+        
+        except json.JSONDecodeError as e:
+            print(f"Error parsing line {line_num}: {e}")
+            continue
+        except Exception as e:
+            print(f"Error processing line {line_num}: {e}")
+            continue
+
     # Insert remaining batches
     if batch:
         cursor.executemany(
             "INSERT OR IGNORE INTO word_clips (word, video_id, start_time, duration) VALUES (?, ?, ?, ?)",
             batch
         )
-        conn.commit()
-    
+
     if phrase_batch:
         cursor.executemany("""
-            INSERT OR IGNORE INTO phrase_index 
+            INSERT OR IGNORE INTO phrase_index
             (phrase_hash, phrase_text, video_id, start_time, end_time, word_count)
             VALUES (?, ?, ?, ?, ?, ?)
         """, phrase_batch)
-        conn.commit()
-    
+
+    # Record the source fingerprint so the next run can skip re-ingest
+    cursor.execute(
+        "INSERT OR REPLACE INTO ingest_meta (source_path, mtime, size) VALUES (?, ?, ?)",
+        (jsonl_path, src_stat.st_mtime, src_stat.st_size)
+    )
+
+    # Single commit for the whole ingest
+    conn.commit()
+
     # Get statistics
     cursor.execute("SELECT COUNT(*) FROM word_clips")
     total_in_db = cursor.fetchone()[0]
@@ -2,10 +2,17 @@
 """Populate database with sample YouTube videos (no API key required)."""
 import sqlite3
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from youtube_transcript_api import YouTubeTranscriptApi, TranscriptsDisabled, NoTranscriptFound
 
 DB_PATH = os.getenv("DB_PATH", "./data/youglish.db")
 
+# Transcript fetches are pure network waits, so overlap them; writes
+# still happen serially on the main thread
+MAX_FETCH_WORKERS = 8
+FETCH_RETRIES = 4
+
 # Popular educational videos with transcripts
 SAMPLE_VIDEOS = [
     # TED Talks
@@ -168,71 +175,91 @@ def insert_segments(conn, video_id, lang, transcript):
         rows,
     )
 
-def fetch_and_store_transcript(conn, video):
-    """Fetch transcript for a video and store in database."""
+def fetch_transcript(video):
+    """Fetch the best transcript for a video (network only, no database).
+
+    Transient errors are retried with exponential backoff (YouTube
+    throttles bursts); disabled/missing transcripts fail immediately.
+
+    Returns:
+        (video, lang, transcript_data) tuple; transcript_data is None on failure.
+    """
     video_id = video["video_id"]
-    
-    try:
-        # First, upsert the video metadata
-        upsert_video(conn, video)
-        
-        # Try to get transcript list
+
+    for attempt in range(FETCH_RETRIES):
         try:
+            # Try to get transcript list
             transcript_list = YouTubeTranscriptApi.list_transcripts(video_id)
-        except Exception as e:
-            print(f"  ✗ No transcripts available for {video_id}: {str(e)[:50]}")
-            return False
-        
-        # Try to find the best transcript
-        transcript = None
-        lang = 'en'
-        
-        # Try English first (manual then auto-generated)
-        try:
-            transcript = transcript_list.find_transcript(['en'])
+
+            # Try to find the best transcript
+            transcript = None
             lang = 'en'
-        except:
-            # Try any available transcript
+
+            # Try English first (manual then auto-generated)
             try:
-                for available_transcript in transcript_list:
-                    transcript = available_transcript
-                    lang = transcript.language_code
-                    break
+                transcript = transcript_list.find_transcript(['en'])
+                lang = 'en'
             except:
-                pass
-        
-        if not transcript:
-            print(f"  ✗ No usable transcript found for {video_id}")
-            return False
-        
-        # Fetch the actual transcript data
-        transcript_data = transcript.fetch()
-        
-        if not transcript_data:
-            print(f"  ✗ Empty transcript for {video_id}")
-            return False
-            
-        insert_segments(conn, video_id, lang, transcript_data)
+                # Try any available transcript
+                try:
+                    for available_transcript in transcript_list:
+                        transcript = available_transcript
+                        lang = transcript.language_code
+                        break
+                except:
+                    pass
+
+            if not transcript:
+                print(f"  ✗ No usable transcript found for {video_id}")
+                return video, None, None
+
+            # Fetch the actual transcript data
+            transcript_data = transcript.fetch()
+
+            if not transcript_data:
+                print(f"  ✗ Empty transcript for {video_id}")
+                return video, None, None
+
+            return video, lang, transcript_data
+
+        except (TranscriptsDisabled, NoTranscriptFound):
+            print(f"  ✗ Transcript disabled for {video_id}")
+            return video, None, None
+        except Exception as e:
+            if attempt + 1 == FETCH_RETRIES:
+                print(f"  ✗ Error fetching {video_id}: {str(e)[:50]}")
+                return video, None, None
+            # 1s, 2s, 4s... between attempts
+            time.sleep(2 ** attempt)
+
+    return video, None, None
+
+
+def store_transcript(conn, video, lang, transcript_data):
+    """Store a fetched transcript (main thread owns the connection)."""
+    video_id = video["video_id"]
+
+    # Always record the video metadata, even when the fetch failed
+    upsert_video(conn, video)
+
+    if not transcript_data:
         conn.commit()
-        
-        # Get stats
-        cursor = conn.execute(
-            "SELECT COUNT(*) as count FROM segments WHERE video_id = ?",
-            (video_id,)
-        )
-        count = cursor.fetchone()[0]
-        
-        print(f"  ✓ {video['title'][:60]}")
-        print(f"    └─ {count} segments ({lang})")
-        return True
-            
-    except (TranscriptsDisabled, NoTranscriptFound) as e:
-        print(f"  ✗ Transcript disabled for {video_id}")
-        return False
-    except Exception as e:
-        print(f"  ✗ Error processing {video_id}: {str(e)[:50]}")
         return False
 
+    insert_segments(conn, video_id, lang, transcript_data)
+    conn.commit()
+
+    # Get stats
+    cursor = conn.execute(
+        "SELECT COUNT(*) as count FROM segments WHERE video_id = ?",
+        (video_id,)
+    )
+    count = cursor.fetchone()[0]
+
+    print(f"  ✓ {video['title'][:60]}")
+    print(f"    └─ {count} segments ({lang})")
+    return True
+
 def main():
     """Main function to populate database."""
     print("="*70)
@@ -254,13 +281,16 @@ def main():
     success_count = 0
     fail_count = 0
     
-    for i, video in enumerate(SAMPLE_VIDEOS, 1):
-        print(f"[{i}/{len(SAMPLE_VIDEOS)}]")
-        if fetch_and_store_transcript(conn, video):
-            success_count += 1
-        else:
-            fail_count += 1
-        print()
+    # Fetch concurrently; insert results in order on this thread
+    with ThreadPoolExecutor(max_workers=MAX_FETCH_WORKERS) as pool:
+        for i, (video, lang, transcript_data) in enumerate(
+                pool.map(fetch_transcript, SAMPLE_VIDEOS), 1):
+            print(f"[{i}/{len(SAMPLE_VIDEOS)}]")
+            if store_transcript(conn, video, lang, transcript_data):
+                success_count += 1
+            else:
+                fail_count += 1
+            print()
     
     conn.close()
     
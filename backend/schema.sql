@@ -21,10 +21,13 @@ CREATE TABLE IF NOT EXISTS segments (
 );
 
 -- FTS index over segments.text
+-- prefix indexes cover short typed-word queries; without them FTS5
+-- expands prefixes by scanning the full term list
 CREATE VIRTUAL TABLE IF NOT EXISTS segments_fts USING fts5(
   text,
   content='segments',
   content_rowid='id',
+  prefix = '2 3 4',
   tokenize = 'unicode61 remove_diacritics 2'
 );
 
@@ -1,6 +1,7 @@
 """Comprehensive tests for the video stitcher system."""
 
 import pytest
+import shutil
 import sqlite3
 import tempfile
 from pathlib import Path
@@ -8,27 +9,43 @@ from pathlib import Path
 from video_stitcher.database import WordClipDatabase, ClipInfo
 
 
-# Test Database Generator Fixture
-@pytest.fixture
-def test_database(tmp_path):
-    """Create a test SQLite database with sample word-clip mappings.
-    
-    This fixture creates a database with 15 sample words mapped to various
-    YouTube videos with different durations.
-    
-    Args:
-        tmp_path: pytest temporary directory fixture.
-        
-    Returns:
-        Path to the test database file.
-    """
-    db_path = tmp_path / "test_words.db"
-    
-    # Create database and table
+# Sample data with real YouTube video IDs (educational/public domain content)
+# Note: These are example IDs - in production, ensure videos are available.
+# Immutable module-level tuples: built once at import, never re-allocated
+# per fixture call
+TEST_DATA = (
+    ("hello", "jNQXAC9IVRw", 5.0, 1.5),      # "Me at the zoo" - first YouTube video
+    ("world", "jNQXAC9IVRw", 10.0, 1.2),
+    ("test", "jNQXAC9IVRw", 15.0, 1.0),
+    ("this", "9bZkp7q19f0", 20.0, 0.8),      # PSY - GANGNAM STYLE
+    ("is", "9bZkp7q19f0", 25.0, 0.7),
+    ("video", "9bZkp7q19f0", 30.0, 1.5),
+    ("python", "kqtD5dpn9C8", 5.0, 1.3),     # Python programming content
+    ("code", "kqtD5dpn9C8", 10.0, 1.1),
+    ("programming", "kqtD5dpn9C8", 15.0, 2.0),
+    ("computer", "dQw4w9WgXcQ", 5.0, 1.4),   # Rick Astley - Never Gonna Give You Up
+    ("science", "dQw4w9WgXcQ", 10.0, 1.6),
+    ("algorithm", "dQw4w9WgXcQ", 15.0, 1.8),
+    ("data", "OPf0YbXqDm0", 5.0, 0.9),       # Mark Rober video
+    ("structure", "OPf0YbXqDm0", 10.0, 1.2),
+    ("learning", "OPf0YbXqDm0", 15.0, 1.7),
+)
+
+# Minimal data for quick tests
+MINIMAL_TEST_DATA = (
+    ("hello", "jNQXAC9IVRw", 5.0, 1.0),
+    ("world", "jNQXAC9IVRw", 10.0, 1.0),
+    ("test", "jNQXAC9IVRw", 15.0, 1.0),
+)
+
+
+def _build_word_clips_db(db_path, test_data):
+    """Create a word_clips database file populated with test_data."""
     conn = sqlite3.connect(str(db_path))
     cursor = conn.cursor()
-    
-    # Create the word_clips table
+    # Large page cache so the whole build stays in memory
+    cursor.execute("PRAGMA cache_size=-8000")
+
     cursor.execute("""
         CREATE TABLE word_clips (
             word TEXT PRIMARY KEY,
@@ -37,36 +54,48 @@ def test_database(tmp_path):
             duration REAL NOT NULL
         )
     """)
-    
-    # Sample data with real YouTube video IDs (educational/public domain content)
-    # Note: These are example IDs - in production, ensure videos are available
-    test_data = [
-        ("hello", "jNQXAC9IVRw", 5.0, 1.5),      # "Me at the zoo" - first YouTube video
-        ("world", "jNQXAC9IVRw", 10.0, 1.2),     
-        ("test", "jNQXAC9IVRw", 15.0, 1.0),
-        ("this", "9bZkp7q19f0", 20.0, 0.8),      # PSY - GANGNAM STYLE
-        ("is", "9bZkp7q19f0", 25.0, 0.7),
-        ("video", "9bZkp7q19f0", 30.0, 1.5),
-        ("python", "kqtD5dpn9C8", 5.0, 1.3),     # Python programming content
-        ("code", "kqtD5dpn9C8", 10.0, 1.1),
-        ("programming", "kqtD5dpn9C8", 15.0, 2.0),
-        ("computer", "dQw4w9WgXcQ", 5.0, 1.4),   # Rick Astley - Never Gonna Give You Up
-        ("science", "dQw4w9WgXcQ", 10.0, 1.6),
-        ("algorithm", "dQw4w9WgXcQ", 15.0, 1.8),
-        ("data", "OPf0YbXqDm0", 5.0, 0.9),       # Mark Rober video
-        ("structure", "OPf0YbXqDm0", 10.0, 1.2),
-        ("learning", "OPf0YbXqDm0", 15.0, 1.7),
-    ]
-    
-    # Insert test data
     cursor.executemany("""
         INSERT INTO word_clips (word, video_id, start_time, duration)
         VALUES (?, ?, ?, ?)
     """, test_data)
-    
+
+    # Match the production schema's video_id index; ANALYZE lets the
+    # planner pick it
+    cursor.execute("CREATE INDEX idx_word_clips_video ON word_clips(video_id)")
+    cursor.execute("ANALYZE")
+
     conn.commit()
     conn.close()
-    
+
+
+# Test Database Generator Fixtures
+#
+# The databases are built once per session and copied per test; a file copy
+# is much cheaper than re-running the DDL and inserts for every test.
+@pytest.fixture(scope="session")
+def _test_database_template(tmp_path_factory):
+    """Build the 15-word template database once per session."""
+    db_path = tmp_path_factory.mktemp("db") / "test_words_template.db"
+    _build_word_clips_db(db_path, TEST_DATA)
+    return db_path
+
+
+@pytest.fixture
+def test_database(_test_database_template, tmp_path):
+    """Create a test SQLite database with sample word-clip mappings.
+
+    This fixture provides a database with 15 sample words mapped to various
+    YouTube videos with different durations.
+
+    Args:
+        _test_database_template: Session-scoped template database.
+        tmp_path: pytest temporary directory fixture.
+
+    Returns:
+        Path to the test database file.
+    """
+    db_path = tmp_path / "test_words.db"
+    shutil.copy(_test_database_template, db_path)
     return str(db_path)
 
 
@@ -80,6 +109,39 @@ class TestDatabase:
         assert db.connection is not None
         db.close()
     
+    def test_database_accepts_existing_connection(self, test_database):
+        """Test that an in-memory copy via backup works through the connection arg."""
+        src = sqlite3.connect(test_database)
+        memory_conn = sqlite3.connect(":memory:")
+        src.backup(memory_conn)
+        src.close()
+
+        db = WordClipDatabase(connection=memory_conn)
+
+        clip_info = db.get_clip_info("hello")
+        assert clip_info is not None
+        assert clip_info.video_id == "jNQXAC9IVRw"
+
+        db.close()
+
+    def test_database_accepts_uri_path(self, test_database):
+        """Test that a shared-cache in-memory URI works as db_path."""
+        uri = "file:uri_test?mode=memory&cache=shared"
+        # Keep the shared in-memory database alive while it is populated
+        holder = sqlite3.connect(uri, uri=True)
+        src = sqlite3.connect(test_database)
+        src.backup(holder)
+        src.close()
+
+        db = WordClipDatabase(uri)
+
+        clip_info = db.get_clip_info("hello")
+        assert clip_info is not None
+        assert clip_info.video_id == "jNQXAC9IVRw"
+
+        db.close()
+        holder.close()
+
     def test_database_connection_failure(self, tmp_path):
         """Test that FileNotFoundError is raised with invalid path."""
         invalid_path = tmp_path / "nonexistent.db"
@@ -172,38 +234,19 @@ class TestDatabase:
 
 
 # Helper function to create a minimal test database
+@pytest.fixture(scope="session")
+def _minimal_test_database_template(tmp_path_factory):
+    """Build the minimal 3-word template database once per session."""
+    db_path = tmp_path_factory.mktemp("db") / "minimal_test_template.db"
+    _build_word_clips_db(db_path, MINIMAL_TEST_DATA)
+    return db_path
+
+
 @pytest.fixture
-def minimal_test_database(tmp_path):
+def minimal_test_database(_minimal_test_database_template, tmp_path):
     """Create a minimal test database with just 3 words for quick testing."""
     db_path = tmp_path / "minimal_test.db"
-    
-    conn = sqlite3.connect(str(db_path))
-    cursor = conn.cursor()
-    
-    cursor.execute("""
-        CREATE TABLE word_clips (
-            word TEXT PRIMARY KEY,
-            video_id TEXT NOT NULL,
-            start_time REAL NOT NULL,
-            duration REAL NOT NULL
-        )
-    """)
-    
-    # Minimal data for quick tests
-    test_data = [
-        ("hello", "jNQXAC9IVRw", 5.0, 1.0),
-        ("world", "jNQXAC9IVRw", 10.0, 1.0),
-        ("test", "jNQXAC9IVRw", 15.0, 1.0),
-    ]
-    
-    cursor.executemany("""
-        INSERT INTO word_clips (word, video_id, start_time, duration)
-        VALUES (?, ?, ?, ?)
-    """, test_data)
-    
-    conn.commit()
-    conn.close()
-    
+    shutil.copy(_minimal_test_database_template, db_path)
     return str(db_path)
 
 
@@ -225,8 +268,26 @@ class TestVideoStitcher:
         words = stitcher.parse_text(text)
         
         assert words == ["hello", "world", "this", "is", "a", "test"]
-        
+
         stitcher.close()
+
+    def test_shared_database_not_closed(self, minimal_test_database):
+        """Test that a caller-provided database survives stitcher close."""
+        from video_stitcher.video_stitcher import VideoStitcher, StitchingConfig
+
+        shared_db = WordClipDatabase(minimal_test_database)
+        config = StitchingConfig(
+            database_path=minimal_test_database,
+            verify_ffmpeg_on_init=False
+        )
+
+        stitcher = VideoStitcher(config, database=shared_db)
+        assert stitcher.database is shared_db
+        stitcher.close()
+
+        # The shared connection must still be usable after close()
+        assert shared_db.get_clip_info("hello") is not None
+        shared_db.close()
     
     def test_lookup_clips(self, minimal_test_database):
         """Test clip lookup separates found and missing words."""
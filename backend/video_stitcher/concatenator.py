@@ -1,6 +1,7 @@
 """Video concatenation module for stitching video segments together."""
 
 import logging
+import os
 import shutil
 import subprocess
 import tempfile
@@ -99,17 +100,75 @@ class VideoConcatenator:
             logger.warning(f"Error validating video {video_path}: {e}")
             return False
     
+    def _probe_stream_params(self, video_path: str) -> tuple:
+        """Probe the codec parameters relevant for stream-copy concatenation.
+
+        Args:
+            video_path: Path to the video file to probe.
+
+        Returns:
+            Tuple of stream parameters, or None if probing fails.
+        """
+        cmd = [
+            'ffprobe',
+            '-v', 'error',
+            '-show_entries', 'stream=codec_name,width,height,r_frame_rate,sample_rate,pix_fmt',
+            '-of', 'csv=p=0',
+            video_path
+        ]
+
+        try:
+            result = subprocess.run(
+                cmd,
+                capture_output=True,
+                text=True,
+                timeout=10
+            )
+            if result.returncode != 0:
+                return None
+            return tuple(result.stdout.split())
+        except Exception as e:
+            logger.debug(f"Stream parameter probe failed for {video_path}: {e}")
+            return None
+
+    def _segments_are_uniform(self, video_paths: List[str]) -> bool:
+        """Check whether all segments share codec parameters for stream copy.
+
+        Args:
+            video_paths: List of video file paths to check.
+
+        Returns:
+            True if all segments have identical codec/resolution/rate params.
+        """
+        reference = None
+        for path in video_paths:
+            params = self._probe_stream_params(path)
+            if params is None:
+                return False
+            if reference is None:
+                reference = params
+            elif params != reference:
+                logger.debug(
+                    f"Segment params differ, stream copy not possible: {path}"
+                )
+                return False
+        return reference is not None
+
     def concatenate_videos(
-        self, 
-        video_paths: List[str], 
-        output_path: str
+        self,
+        video_paths: List[str],
+        output_path: str,
+        stream_copy: bool = False
     ) -> None:
         """Concatenate videos using ffmpeg concat demuxer.
-        
+
         Args:
             video_paths: List of video file paths to concatenate.
             output_path: Path to the output file.
-            
+            stream_copy: If True and all segments share codec parameters,
+                concatenate with '-c copy' instead of re-encoding. Falls back
+                to re-encoding when parameters differ or the copy fails.
+
         Raises:
             ValueError: If any input file doesn't exist or is invalid.
             RuntimeError: If concatenation fails.
@@ -133,7 +192,46 @@ class VideoConcatenator:
         
         # Create concat file
         concat_file = self.create_concat_file(video_paths)
-        
+
+        # Try lossless stream copy first when all segments were encoded with
+        # identical parameters (the processing step guarantees this for
+        # processed segments) - avoids a second full re-encode of the output
+        if stream_copy and self._segments_are_uniform(video_paths):
+            copy_cmd = [
+                'ffmpeg',
+                '-f', 'concat',
+                '-safe', '0',
+                '-i', concat_file,
+                '-c', 'copy',
+                '-movflags', '+faststart',
+                '-y',
+                output_path
+            ]
+
+            try:
+                logger.debug(f"Running ffmpeg stream-copy concat: {' '.join(copy_cmd)}")
+                subprocess.run(
+                    copy_cmd,
+                    capture_output=True,
+                    check=True,
+                    text=True
+                )
+
+                output_file = Path(output_path)
+                if output_file.exists() and output_file.stat().st_size > 0:
+                    logger.info(
+                        f"Successfully concatenated {len(video_paths)} videos to {output_path} (stream copy)"
+                    )
+                    # Cleanup concat file (single unlink, no stat round-trip)
+                    Path(concat_file).unlink(missing_ok=True)
+                    if concat_file in self.temp_files:
+                        self.temp_files.remove(concat_file)
+                    return
+
+                logger.warning("Stream-copy concat produced empty output, falling back to re-encode")
+            except subprocess.CalledProcessError as e:
+                logger.warning(f"Stream-copy concat failed, falling back to re-encode: {e.stderr}")
+
         # Run ffmpeg concat command with re-encoding for compatibility
         # This ensures all videos are properly stitched even with different codecs
         # Videos are validated before this point to ensure they have valid streams
@@ -181,11 +279,10 @@ class VideoConcatenator:
             logger.error(f"Concat file contents: {Path(concat_file).read_text() if Path(concat_file).exists() else 'N/A'}")
             raise RuntimeError(error_msg) from e
         finally:
-            # Cleanup concat file
-            if Path(concat_file).exists():
-                Path(concat_file).unlink()
-                if concat_file in self.temp_files:
-                    self.temp_files.remove(concat_file)
+            # Cleanup concat file (single unlink, no stat round-trip)
+            Path(concat_file).unlink(missing_ok=True)
+            if concat_file in self.temp_files:
+                self.temp_files.remove(concat_file)
     
     def concatenate_incremental(
         self, 
@@ -277,15 +374,20 @@ class VideoConcatenator:
                 raise
             
             # Delete the previous current video
-            if current_video.exists():
-                current_video.unlink()
+            current_video.unlink(missing_ok=True)
+            if str(current_video) in self.temp_files:
                 self.temp_files.remove(str(current_video))
             
             # Update current video to the new output
             current_video = temp_output
         
-        # Rename final result to output path
-        shutil.move(str(current_video), output_path)
+        # Rename final result to output path; os.replace is an atomic rename
+        # when temp and output share a filesystem, falling back to a copy
+        # move only when they don't
+        try:
+            os.replace(str(current_video), output_path)
+        except OSError:
+            shutil.move(str(current_video), output_path)
         if str(current_video) in self.temp_files:
             self.temp_files.remove(str(current_video))
         
@@ -298,19 +400,14 @@ class VideoConcatenator:
         # Remove tracked temporary files
         for temp_file in self.temp_files[:]:  # Copy list to avoid modification during iteration
             try:
-                path = Path(temp_file)
-                if path.exists():
-                    path.unlink()
-                    logger.debug(f"Deleted temp file: {temp_file}")
+                Path(temp_file).unlink(missing_ok=True)
+                logger.debug(f"Deleted temp file: {temp_file}")
             except Exception as e:
                 logger.warning(f"Failed to delete temp file {temp_file}: {str(e)}")
             finally:
                 self.temp_files.remove(temp_file)
         
-        # Remove temp directory
-        try:
-            if self.temp_dir.exists():
-                shutil.rmtree(self.temp_dir, ignore_errors=True)
-                logger.debug(f"Removed temp directory: {self.temp_dir}")
-        except Exception as e:
-            logger.warning(f"Failed to remove temp directory {self.temp_dir}: {str(e)}")
+        # Remove temp directory; rmtree with ignore_errors already handles
+        # a missing path, so no stat() round-trip beforehand
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        logger.debug(f"Removed temp directory: {self.temp_dir}")
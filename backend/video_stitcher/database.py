@@ -1,8 +1,10 @@
 """Database interface module for querying word-to-clip mappings."""
 
 import sqlite3
+import functools
 import logging
 import hashlib
+import sys
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional, List
@@ -10,6 +12,23 @@ from typing import Optional, List
 logger = logging.getLogger(__name__)
 
 
+def _kmp_failure(pattern: List[int]) -> List[int]:
+    """Build the KMP prefix table for a token pattern.
+
+    failure[i] is the length of the longest proper prefix of
+    pattern[:i+1] that is also a suffix of it.
+    """
+    failure = [0] * len(pattern)
+    k = 0
+    for i in range(1, len(pattern)):
+        while k and pattern[i] != pattern[k]:
+            k = failure[k - 1]
+        if pattern[i] == pattern[k]:
+            k += 1
+        failure[i] = k
+    return failure
+
+
 @dataclass
 class ClipInfo:
     """Information about a video clip for a word."""
@@ -21,30 +40,59 @@ class ClipInfo:
 
 class WordClipDatabase:
     """Database interface for looking up video clips by word."""
-    
-    def __init__(self, db_path: str):
+
+    # Fixed chunk size for batched word lookups (see get_clips_for_words)
+    MAX_LOOKUP_BATCH = 64
+
+    def __init__(self, db_path: Optional[str] = None, connection: Optional[sqlite3.Connection] = None):
         """Initialize database connection.
-        
+
         Args:
-            db_path: Path to the SQLite database file.
-            
+            db_path: Path to the SQLite database file, or a SQLite URI
+                (e.g. "file:test?mode=memory&cache=shared").
+            connection: Optional existing connection to use instead of
+                opening db_path (e.g. an in-memory database populated via
+                sqlite3.Connection.backup).
+
         Raises:
             FileNotFoundError: If database file doesn't exist.
-            ValueError: If database schema is invalid.
+            ValueError: If database schema is invalid, or neither db_path
+                nor connection is given.
         """
-        self.db_path = Path(db_path)
-        
-        # Verify database file exists
-        if not self.db_path.exists():
-            raise FileNotFoundError(f"Database file not found: {db_path}")
-        
-        # Open SQLite connection
-        self.connection = sqlite3.connect(str(self.db_path))
+        if connection is not None:
+            self.db_path = Path(db_path) if db_path else None
+            self.connection = connection
+        elif db_path is not None and db_path.startswith("file:"):
+            # URI form: sqlite3 handles mode/cache parameters itself, and
+            # an exists() check makes no sense for mode=memory
+            self.db_path = db_path
+            self.connection = sqlite3.connect(db_path, uri=True)
+        elif db_path is not None:
+            self.db_path = Path(db_path)
+
+            # Verify database file exists
+            if not self.db_path.exists():
+                raise FileNotFoundError(f"Database file not found: {db_path}")
+
+            # Open SQLite connection
+            self.connection = sqlite3.connect(str(self.db_path))
+        else:
+            raise ValueError("Either db_path or connection must be provided")
         self.connection.row_factory = sqlite3.Row
         
         # Verify table schema
         self._verify_schema()
-        
+
+        # Memoize single-word lookups; repeated words in a script hit the
+        # cache instead of re-running the prepare/step/fetch cycle
+        self._lookup_clip = functools.lru_cache(maxsize=4096)(self._lookup_clip)
+
+        # Columnar transcript cache: video_id -> (tokens, starts, ends).
+        # Decoding the transcript JSON and lowercasing its words dominates
+        # the fallback phrase scan, so each video pays that cost only once
+        # per connection.
+        self._transcript_cache = {}
+
         logger.info(f"Database opened: {db_path}")
     
     def _verify_schema(self) -> None:
@@ -123,15 +171,22 @@ class WordClipDatabase:
     
     def get_clip_info(self, word: str, exclude_video_ids: Optional[List[str]] = None, channel_id: Optional[str] = None) -> Optional[ClipInfo]:
         """Look up clip information for a single word, optionally excluding certain videos and filtering by channel.
-        
+
         Args:
             word: The word to search for (case-insensitive).
             exclude_video_ids: Optional list of video IDs to exclude from results.
             channel_id: Optional channel ID to filter results to.
-            
+
         Returns:
             ClipInfo object if word is found, None otherwise.
         """
+        # Normalize to hashable, order-independent cache keys so repeated
+        # lookups of common words skip SQLite entirely
+        exclude_key = tuple(sorted(exclude_video_ids)) if exclude_video_ids else ()
+        return self._lookup_clip(word.lower(), exclude_key, channel_id)
+
+    def _lookup_clip(self, word: str, exclude_video_ids: tuple, channel_id: Optional[str]) -> Optional[ClipInfo]:
+        """Uncached single-word lookup; wrapped with lru_cache in __init__."""
         cursor = self.connection.cursor()
         
         # Build base query with channel filter
@@ -206,38 +261,44 @@ class WordClipDatabase:
         """
         if not words:
             return []
-        
+
         cursor = self.connection.cursor()
-        
-        # Build query with placeholders
-        placeholders = ','.join('?' * len(words))
+        lowered = [w.lower() for w in words]
+
+        # Query in fixed-size chunks so SQLite sees one SQL shape per run
+        # (keeps its prepared-statement cache hot) and parameter counts
+        # stay well under the host limit. The final chunk is padded with
+        # repeats so even it reuses the same statement.
+        results = {}
         query = f"""
-            SELECT word, video_id, start_time, duration 
-            FROM word_clips 
-            WHERE LOWER(word) IN ({placeholders})
+            SELECT word, video_id, start_time, duration
+            FROM word_clips
+            WHERE LOWER(word) IN ({','.join('?' * self.MAX_LOOKUP_BATCH)})
         """
+        for offset in range(0, len(lowered), self.MAX_LOOKUP_BATCH):
+            chunk = lowered[offset:offset + self.MAX_LOOKUP_BATCH]
+            if len(chunk) < self.MAX_LOOKUP_BATCH:
+                chunk = chunk + [chunk[-1]] * (self.MAX_LOOKUP_BATCH - len(chunk))
+            cursor.execute(query, chunk)
+
+            # Build dictionary of results (lowercase key)
+            for row in cursor.fetchall():
+                results[row['word'].lower()] = ClipInfo(
+                    word=row['word'],
+                    video_id=row['video_id'],
+                    start_time=row['start_time'],
+                    duration=row['duration']
+                )
         
-        # Execute query with lowercase words
-        cursor.execute(query, [w.lower() for w in words])
-        
-        # Build dictionary of results (lowercase key)
-        results = {}
-        for row in cursor.fetchall():
-            results[row['word'].lower()] = ClipInfo(
-                word=row['word'],
-                video_id=row['video_id'],
-                start_time=row['start_time'],
-                duration=row['duration']
-            )
-        
-        # Build output list maintaining input order
+        # Build output list maintaining input order, reusing the lowercased
+        # forms computed for the query
         output = []
-        for word in words:
-            clip_info = results.get(word.lower())
+        for word, word_lc in zip(words, lowered):
+            clip_info = results.get(word_lc)
             if clip_info is None:
                 logger.warning(f"Word not found in database: {word}")
             output.append(clip_info)
-        
+
         return output
     
     def get_transcript(self, video_id: str) -> Optional[List[List]]:
@@ -357,6 +418,30 @@ class WordClipDatabase:
         
         return None
     
+    def filter_indexed_phrases(self, phrases: List[str]) -> set:
+        """Return the subset of phrases whose hash exists in phrase_index.
+
+        One IN query over all candidate hashes replaces a point lookup
+        per phrase when a caller probes several phrase lengths at once.
+
+        Args:
+            phrases: Candidate phrases (space-separated words).
+
+        Returns:
+            Set of phrases present in the index (empty if no index).
+        """
+        if not self.has_phrase_index or not phrases:
+            return set()
+
+        hashes = {self._phrase_hash(p): p for p in phrases}
+        cursor = self.connection.cursor()
+        cursor.execute(
+            f"SELECT DISTINCT phrase_hash FROM phrase_index "
+            f"WHERE phrase_hash IN ({','.join('?' * len(hashes))})",
+            tuple(hashes)
+        )
+        return {hashes[row['phrase_hash']] for row in cursor.fetchall()}
+
     def _scan_transcripts_for_phrase(
         self,
         phrase: str,
@@ -374,67 +459,156 @@ class WordClipDatabase:
             return None
         
         import json
-        words = phrase.lower().split()
+        # Interned query words share identity with the cached tokens, so
+        # dict probes in the scan short-circuit on pointer equality
+        words = [sys.intern(w) for w in phrase.lower().split()]
         if not words:
             return None
         
         cursor = self.connection.cursor()
-        
+
+        # Inverted-index prefilter: word_clips already maps word -> video_id,
+        # so only videos containing every query word can contain the phrase.
+        # This avoids decoding and scanning transcripts that cannot match.
+        # Ingest stores words lowercased, so a plain equality match keeps
+        # the word index usable (LOWER(word) would force a full scan).
+        unique_words = sorted(set(words))
+        candidate_subquery = f"""
+            SELECT video_id FROM word_clips
+            WHERE word IN ({','.join('?' * len(unique_words))})
+            GROUP BY video_id
+            HAVING COUNT(DISTINCT word) = ?
+        """
+        candidate_params = (*unique_words, len(unique_words))
+
         # Add channel filter if specified
         if channel_id:
-            cursor.execute("""
-                SELECT vt.video_id, vt.transcript_data 
+            cursor.execute(f"""
+                SELECT vt.video_id, vt.transcript_data
                 FROM video_transcripts vt
                 JOIN videos v ON vt.video_id = v.video_id
                 WHERE v.channel_id = ?
-            """, (channel_id,))
+                AND vt.video_id IN ({candidate_subquery})
+            """, (channel_id,) + candidate_params)
         else:
-            cursor.execute("SELECT video_id, transcript_data FROM video_transcripts")
+            cursor.execute(f"""
+                SELECT video_id, transcript_data FROM video_transcripts
+                WHERE video_id IN ({candidate_subquery})
+            """, candidate_params)
         
         # First pass: try to find in videos NOT in exclusion list
         found_excluded = None
-        for row in cursor.fetchall():
+        num_words = len(words)
+
+        # Single words (the common fallback case) need no automaton at
+        # all; list.index is a C-level scan
+        single_word = words[0] if num_words == 1 else None
+
+        # Raw-substring needles for a pre-decode guard: a quoted token
+        # like "hello" can only appear in the transcript JSON if that
+        # word is present. Restricted to ASCII alnum words — json.dumps
+        # escapes non-ASCII to \uXXXX, so wider needles would
+        # false-negative and hide real matches.
+        needles = [f'"{w}"' for w in unique_words if w.isascii() and w.isalnum()]
+
+        if single_word is None:
+            # Encode the query as small ints so the scan compares ints
+            # instead of strings; any transcript token outside the query
+            # vocabulary collapses to -1 and can never match
+            query_ids = {}
+            for w in words:
+                query_ids.setdefault(w, len(query_ids))
+            pattern = [query_ids[w] for w in words]
+            failure = _kmp_failure(pattern)
+
+        # Iterate the cursor lazily: returning on the first non-excluded
+        # match stops SQLite from materializing the remaining transcript
+        # rows, instead of fetchall() paying for every candidate upfront
+        for row in cursor:
             video_id = row['video_id']
-            transcript = json.loads(row['transcript_data'])
-            
-            # Search for consecutive word sequence
-            for i in range(len(transcript) - len(words) + 1):
-                # Check if words match
-                matches = True
-                for j, word in enumerate(words):
-                    if transcript[i + j][0].lower() != word:
-                        matches = False
-                        break
-                
-                if matches:
-                    # Calculate start_time and duration with padding for cleaner cuts
-                    # Padding helps account for speech recognition inaccuracies and natural speech flow
-                    original_start = transcript[i][1]  # Start of first word
-                    original_end = transcript[i + len(words) - 1][2]  # End of last word
-                    
-                    # Apply padding (ensure start doesn't go negative)
-                    start_time = max(0, original_start - padding_start)
-                    end_time = original_end + padding_end
-                    duration = end_time - start_time
-                    
-                    clip = ClipInfo(
-                        word=phrase,  # Store the full phrase
-                        video_id=video_id,
-                        start_time=start_time,
-                        duration=duration
-                    )
-                    
-                    # If this video is not excluded, return immediately
-                    if not exclude_video_ids or video_id not in exclude_video_ids:
-                        logger.info(f"Found phrase '{phrase}' in non-repeated video {video_id}: {start_time}s-{end_time}s")
-                        return clip
-                    
-                    # Store the first match from excluded videos as fallback
-                    if found_excluded is None:
-                        found_excluded = clip
-                        logger.debug(f"Found phrase '{phrase}' in excluded video {video_id}, continuing search...")
-                    
-                    break  # Only use first occurrence per video
+
+            cached = self._transcript_cache.get(video_id)
+            if cached is None:
+                raw = row['transcript_data']
+                # str.find runs at C speed, so reject transcripts that
+                # cannot contain every query word before paying for the
+                # JSON decode
+                raw_lower = raw.lower()
+                if any(needle not in raw_lower for needle in needles):
+                    continue
+                transcript = json.loads(raw)
+                # Drop malformed entries here, once per video, so the
+                # scan loop can assume [word, start, end] layout without
+                # any type or length checks
+                entries = [
+                    e for e in transcript
+                    if isinstance(e, list) and len(e) >= 3 and isinstance(e[0], str)
+                ]
+                # Split into parallel columns: lowercased tokens for
+                # matching, start/end times for clip extraction. Common
+                # tokens repeat across every transcript, so interning
+                # collapses the duplicates to one allocation each.
+                cached = (
+                    [sys.intern(e[0].lower()) for e in entries],
+                    [e[1] for e in entries],
+                    [e[2] for e in entries],
+                )
+                self._transcript_cache[video_id] = cached
+            tokens, starts, ends = cached
+
+            if single_word is not None:
+                try:
+                    match_start = tokens.index(single_word)
+                except ValueError:
+                    continue
+            else:
+                # KMP walk: one pass over the token stream, falling back
+                # through the failure table on mismatch instead of
+                # re-comparing a window at every offset. Tokens are
+                # encoded inline as they are consumed, so no intermediate
+                # id list is materialized per video.
+                match_start = -1
+                j = 0
+                get_id = query_ids.get
+                for i, token in enumerate(tokens):
+                    token_id = get_id(token, -1)
+                    while j and token_id != pattern[j]:
+                        j = failure[j - 1]
+                    if token_id == pattern[j]:
+                        j += 1
+                        if j == num_words:
+                            match_start = i - num_words + 1
+                            break  # Only use first occurrence per video
+
+                if match_start < 0:
+                    continue
+
+            # Calculate start_time and duration with padding for cleaner cuts
+            # Padding helps account for speech recognition inaccuracies and natural speech flow
+            original_start = starts[match_start]  # Start of first word
+            original_end = ends[match_start + num_words - 1]  # End of last word
+
+            # Apply padding (ensure start doesn't go negative)
+            start_time = max(0, original_start - padding_start)
+            end_time = original_end + padding_end
+            duration = end_time - start_time
+
+            clip = ClipInfo(
+                word=phrase,  # Store the full phrase
+                video_id=video_id,
+                start_time=start_time,
+                duration=duration
+            )
+
+            # If this video is not excluded, return immediately
+            if not exclude_video_ids or video_id not in exclude_video_ids:
+                logger.info(f"Found phrase '{phrase}' in non-repeated video {video_id}: {start_time}s-{end_time}s")
+                return clip
+
+            # Store the first match from excluded videos as fallback
+            if found_excluded is None:
+                found_excluded = clip
+                logger.debug(f"Found phrase '{phrase}' in excluded video {video_id}, continuing search...")
         
         # If we only found it in excluded videos, use that as fallback
         if found_excluded is not None:
@@ -450,26 +624,30 @@ class WordClipDatabase:
         exclude_video_ids: Optional[List[str]] = None, 
         channel_id: Optional[str] = None,
         padding_start: float = 0.15,
-        padding_end: float = 0.15
+        padding_end: float = 0.15,
+        check_index: bool = True
     ) -> Optional[ClipInfo]:
         """Find a phrase (consecutive words) in the video transcripts or phrase index.
-        
+
         This method first tries the fast phrase_index lookup. If the phrase is not
         found in the index (rare phrases), it falls back to scanning transcripts directly.
-        
+
         Args:
             phrase: Space-separated words to find as a consecutive sequence.
             exclude_video_ids: Optional list of video IDs to exclude from results.
             channel_id: Optional channel ID to filter results to.
             padding_start: Padding before first word start (seconds).
             padding_end: Padding after last word end (seconds).
-            
+            check_index: Set False to skip the phrase_index probe when the
+                caller already knows the phrase is absent from the index
+                (see filter_indexed_phrases).
+
         Returns:
             ClipInfo with calculated start_time and duration spanning the phrase,
             or None if phrase is not found in any video.
         """
         # Try fast lookup in phrase index first (if available)
-        if self.has_phrase_index:
+        if self.has_phrase_index and check_index:
             result = self._lookup_phrase_index(
                 phrase,
                 exclude_video_ids=exclude_video_ids,
@@ -562,6 +740,10 @@ class WordClipDatabase:
     
     def close(self) -> None:
         """Close database connection."""
+        if hasattr(self, '_lookup_clip') and hasattr(self._lookup_clip, 'cache_clear'):
+            self._lookup_clip.cache_clear()
+        if hasattr(self, '_transcript_cache'):
+            self._transcript_cache.clear()
         if hasattr(self, 'connection') and self.connection:
             self.connection.close()
             logger.debug("Database connection closed")
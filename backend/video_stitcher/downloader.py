@@ -1,6 +1,8 @@
 """Video segment downloader module using yt-dlp."""
 
+import hashlib
 import logging
+import threading
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Callable
@@ -45,6 +47,11 @@ class VideoSegmentDownloader:
         
         # Create output directory if it doesn't exist
         self.output_dir.mkdir(parents=True, exist_ok=True)
+
+        # Identical clips share a cache filename, so concurrent downloads
+        # of the same clip must be serialized (one lock per cache key)
+        self._key_locks = {}
+        self._key_locks_guard = threading.Lock()
         logger.info(f"Downloader initialized with output directory: {self.output_dir}")
     
     def _make_download_range(self, start: float, end: float) -> Callable:
@@ -69,7 +76,8 @@ class VideoSegmentDownloader:
         
         Args:
             clip_info: Information about the clip to download.
-            clip_index: Index of this clip in the sequence (for unique naming).
+            clip_index: Index of this clip in the sequence (kept for API
+                compatibility; filenames are keyed by clip identity).
             
         Returns:
             Path to the downloaded file.
@@ -89,17 +97,53 @@ class VideoSegmentDownloader:
             f"padded={start_time:.2f}s-{end_time:.2f}s"
         )
         
-        # Generate unique output filename with index prefix to ensure uniqueness and preserve order
-        filename = f"{clip_index:04d}_{clip_info.video_id}_{clip_info.start_time:.2f}_{clip_info.duration:.2f}"
+        # Name downloads by content identity rather than clip position, so
+        # re-generating a script (or reusing a word in a new one) hits the
+        # cache instead of re-downloading from YouTube
+        cache_key = hashlib.blake2b(
+            f"{clip_info.video_id}|{clip_info.start_time:.2f}|{clip_info.duration:.2f}|"
+            f"{self.config.clip_padding_start}|{self.config.clip_padding_end}".encode(),
+            digest_size=12
+        ).hexdigest()
+        filename = f"{clip_info.video_id}_{cache_key}"
         output_template = str(self.output_dir / filename)
-        
-        # Check if segment already exists in cache (check for common extensions)
-        for ext in ['.mp4', '.webm', '.mkv', '.m4a']:
-            cached_path = Path(output_template + ext)
-            if cached_path.exists():
-                logger.info(f"Using cached segment: {cached_path.name}")
-                return str(cached_path)
-        
+
+        # A generation can contain the same clip twice (e.g. a repeated
+        # word with a single source video); both map to this filename, so
+        # hold a per-key lock while downloading. The worker that loses the
+        # race waits here and then hits the cache check below.
+        with self._key_locks_guard:
+            key_lock = self._key_locks.setdefault(cache_key, threading.Lock())
+
+        with key_lock:
+            # Check if segment already exists in cache (check for common extensions)
+            for ext in ['.mp4', '.webm', '.mkv', '.m4a']:
+                cached_path = Path(output_template + ext)
+                if cached_path.exists():
+                    logger.info(f"Using cached segment: {cached_path.name}")
+                    return str(cached_path)
+
+            return self._download_to_cache(
+                clip_info, output_template, filename, start_time, end_time
+            )
+
+    def _download_to_cache(self, clip_info: ClipInfo, output_template: str,
+                           filename: str, start_time: float, end_time: float) -> str:
+        """Run yt-dlp and locate the file it wrote (caller holds the key lock).
+
+        Args:
+            clip_info: Information about the clip to download.
+            output_template: Cache path without extension.
+            filename: Cache filename without extension.
+            start_time: Segment start in seconds.
+            end_time: Segment end in seconds.
+
+        Returns:
+            Path to the downloaded file.
+
+        Raises:
+            DownloadError: If download fails after retries.
+        """
         # Configure yt-dlp options
         # Note: We use download_ranges ONLY, without postprocessor_args to avoid
         # double-processing which can corrupt the video stream
@@ -171,6 +171,131 @@ class VideoProcessor:
             logger.error(error_msg)
             raise RuntimeError(error_msg) from e
     
+    def process_all(
+        self,
+        input_path: str,
+        output_path: str,
+        *,
+        normalize_audio: bool = True,
+        aspect_ratio: str = "16:9",
+        subtitle_text: Optional[str] = None,
+        watermark_text: Optional[str] = None
+    ) -> None:
+        """Run the full per-segment processing chain in one ffmpeg invocation.
+
+        Combines audio normalization, re-encoding for concatenation, aspect
+        ratio resizing, subtitle overlay and watermarking into a single
+        decode/encode pass instead of one ffmpeg process per step.
+
+        Args:
+            input_path: Path to input video file.
+            output_path: Path to output video file.
+            normalize_audio: Apply loudnorm audio normalization.
+            aspect_ratio: Target aspect ratio ('16:9', '9:16', '1:1').
+            subtitle_text: Optional subtitle text to overlay.
+            watermark_text: Optional watermark text to add.
+
+        Raises:
+            RuntimeError: If ffmpeg command fails.
+        """
+        logger.info(f"Processing segment (fused): {input_path} -> {output_path}")
+
+        video_filters = []
+
+        # Scale and pad to target aspect ratio (16:9 inputs are left as-is)
+        if aspect_ratio != "16:9":
+            resolutions = {
+                "9:16": (1080, 1920),
+                "1:1": (1080, 1080)
+            }
+            if aspect_ratio not in resolutions:
+                raise ValueError(f"Unsupported aspect ratio: {aspect_ratio}")
+            target_width, target_height = resolutions[aspect_ratio]
+            video_filters.append(
+                f"scale={target_width}:{target_height}:force_original_aspect_ratio=decrease,"
+                f"pad={target_width}:{target_height}:(ow-iw)/2:(oh-ih)/2:color=black"
+            )
+
+        if subtitle_text:
+            text_escaped = subtitle_text.replace("'", "'\\\\\\''").replace(":", "\\:")
+            video_filters.append(
+                f"drawtext=text='{text_escaped}':"
+                f"fontsize=48:"
+                f"fontcolor=white:"
+                f"x=(w-text_w)/2:"
+                f"y=h-text_h-h*0.1:"
+                f"box=1:"
+                f"boxcolor=black@0.6:"
+                f"boxborderw=10"
+            )
+
+        if watermark_text:
+            text_escaped = watermark_text.replace("'", "'\\\\\\''").replace(":", "\\:")
+            video_filters.append(
+                f"drawtext=text='{text_escaped}':"
+                f"fontsize=24:"
+                f"fontcolor=white@0.7:"
+                f"x=w-text_w-10:"
+                f"y=h-text_h-10:"
+                f"shadowcolor=black@0.5:"
+                f"shadowx=2:"
+                f"shadowy=2"
+            )
+
+        cmd = ['ffmpeg', '-i', input_path, '-map', '0']
+
+        if video_filters:
+            cmd.extend(['-vf', ','.join(video_filters)])
+
+        if normalize_audio:
+            cmd.extend(['-af', 'loudnorm=I=-16:TP=-1.5:LRA=11'])
+
+        cmd.extend([
+            '-c:v', 'libx264',
+            '-preset', 'veryfast',
+            '-crf', '23',
+            '-pix_fmt', 'yuv420p',  # Ensure consistent pixel format
+            '-r', '30',              # Set frame rate to 30fps for consistency
+            '-g', '30',              # Keyframe interval (1 per second at 30fps)
+            '-c:a', 'aac',
+            '-b:a', '128k',
+            '-ar', '44100',
+            '-ac', '2',              # Stereo audio
+            '-movflags', '+faststart',  # Enable streaming
+            '-threads', '0',         # Use all available CPU cores
+            '-y',  # Overwrite without prompting
+            output_path
+        ])
+
+        try:
+            result = subprocess.run(
+                cmd,
+                capture_output=True,
+                check=True,
+                text=True,
+                timeout=120  # Single pass replaces up to 5 sequential encodes
+            )
+
+            # Validate output file has valid streams
+            if not Path(output_path).exists() or Path(output_path).stat().st_size < 1000:
+                raise RuntimeError(f"Processed file is empty or missing: {output_path}")
+
+            logger.debug(f"Segment processing completed: {output_path}")
+        except subprocess.TimeoutExpired:
+            error_msg = f"Segment processing timed out (file may be corrupted): {input_path}"
+            logger.error(error_msg)
+            raise RuntimeError(error_msg)
+        except subprocess.CalledProcessError as e:
+            # Check if error is due to corrupted input
+            if "Invalid NAL unit" in e.stderr or "Invalid data" in e.stderr or "Error splitting" in e.stderr:
+                error_msg = f"Segment processing failed - input file appears corrupted: {input_path}"
+                logger.error(error_msg)
+                logger.debug(f"FFmpeg stderr: {e.stderr}")
+                raise RuntimeError(error_msg) from e
+            error_msg = f"Segment processing failed: {e.stderr}"
+            logger.error(error_msg)
+            raise RuntimeError(error_msg) from e
+
     def trim_exact(
         self, 
         input_path: str, 
@@ -1,7 +1,16 @@
 """Main video stitcher orchestrator module."""
 
+import asyncio
+import functools
+import hashlib
 import logging
+import os
+import queue
 import re
+import shutil
+import string
+import subprocess
+import threading
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError
 from dataclasses import dataclass
@@ -16,6 +25,74 @@ from .auphonic_client import get_auphonic_client_from_env, AuphonicError
 
 logger = logging.getLogger(__name__)
 
+# Compiled once at import; matches words with optional internal apostrophes
+# (don't, isn't, etc.)
+_WORD_RE = re.compile(r"\b[\w']+\b")
+
+# ASCII-only lowercase table; str.translate with a table hits CPython's
+# fast path, and the word dataset is lowercase ASCII anyway
+_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+# Output resolutions per supported aspect ratio
+_TARGET_DIMENSIONS = {
+    "16:9": (1920, 1080),
+    "9:16": (1080, 1920),
+    "1:1": (1080, 1080)
+}
+
+
+def _rmtree_dirfd(dir_fd: int) -> None:
+    """Recursively empty the directory open at dir_fd using unlinkat.
+
+    Operating on the open directory FD skips per-file path resolution in
+    the kernel, so throughput scales with entry count rather than path
+    depth times entries.
+    """
+    for entry in os.scandir(dir_fd):
+        if entry.is_dir(follow_symlinks=False):
+            child_fd = os.open(entry.name, os.O_RDONLY | os.O_DIRECTORY, dir_fd=dir_fd)
+            try:
+                _rmtree_dirfd(child_fd)
+            finally:
+                os.close(child_fd)
+            os.rmdir(entry.name, dir_fd=dir_fd)
+        else:
+            os.unlink(entry.name, dir_fd=dir_fd)
+
+
+def _fast_rmtree(path: Path) -> None:
+    """Delete a directory tree, preferring a single rm subprocess.
+
+    One `rm -rf` is markedly faster than Python's walk-and-unlink loop for
+    directories holding hundreds of video fragments. When spawning rm is
+    not possible, fall back to an in-process unlinkat-based delete, and
+    only then to shutil.rmtree.
+    """
+    try:
+        subprocess.run(["rm", "-rf", "--", str(path)], check=False)
+        return
+    except (OSError, FileNotFoundError):
+        pass
+
+    try:
+        dir_fd = os.open(str(path), os.O_RDONLY | os.O_DIRECTORY)
+    except FileNotFoundError:
+        return
+    except OSError:
+        shutil.rmtree(path, ignore_errors=True)
+        return
+    try:
+        _rmtree_dirfd(dir_fd)
+    except OSError:
+        shutil.rmtree(path, ignore_errors=True)
+        return
+    finally:
+        os.close(dir_fd)
+    try:
+        os.rmdir(str(path))
+    except OSError:
+        pass
+
 
 @dataclass
 class StitchingConfig:
@@ -51,24 +128,37 @@ class StitchingConfig:
 class VideoStitcher:
     """Main class that orchestrates video stitching from text."""
     
-    def __init__(self, config: StitchingConfig):
+    def __init__(self, config: StitchingConfig, database: Optional[WordClipDatabase] = None):
         """Initialize the video stitcher.
-        
+
         Args:
             config: Configuration for the stitcher.
+            database: Optional already-open WordClipDatabase to share;
+                callers running several stitchers can skip repeated
+                connect + schema-verification cycles. A shared database
+                is not closed by close().
         """
         self.config = config
-        
+
+        # Sentinels first so close() is safe even if init fails partway
+        self.database = None
+        self._executor = None
+
         # Create output directory
         self.output_dir = Path(config.output_directory)
         self.output_dir.mkdir(parents=True, exist_ok=True)
-        
+
         # Create temp directory
         self.temp_dir = Path(config.temp_directory)
         self.temp_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Initialize database
-        self.database = WordClipDatabase(config.database_path)
+
+        # Initialize database (or adopt the caller's open one)
+        if database is not None:
+            self.database = database
+            self._owns_database = False
+        else:
+            self.database = WordClipDatabase(config.database_path)
+            self._owns_database = True
         
         # Initialize downloader
         downloader_config = VideoDownloaderConfig(
@@ -86,7 +176,14 @@ class VideoStitcher:
         self.concatenator = VideoConcatenator(
             temp_dir=str(self.temp_dir / "concat")
         )
-        
+
+        # Shared worker pool reused across the download, placeholder and
+        # processing phases (avoids re-spawning threads per phase)
+        self._executor = (
+            ThreadPoolExecutor(max_workers=config.max_workers)
+            if config.max_workers > 1 else None
+        )
+
         logger.info("VideoStitcher initialized")
     
     def parse_text(self, text: str) -> List[str]:
@@ -98,12 +195,9 @@ class VideoStitcher:
         Returns:
             List of words in lowercase, preserving order.
         """
-        # Extract words using regex that preserves contractions, convert to lowercase
-        # This pattern matches words with optional internal apostrophes (don't, isn't, etc.)
-        words = re.findall(r"\b[\w']+\b", text.lower())
-        
-        # Remove empty strings and standalone apostrophes
-        words = [w for w in words if w and w != "'"]
+        # Extract words using the precompiled regex, filtering standalone
+        # apostrophes in the same pass
+        words = [w for w in _WORD_RE.findall(text.translate(_LOWER)) if w != "'"]
         
         logger.debug(f"Parsed {len(words)} words from text: {words}")
         return words
@@ -129,26 +223,53 @@ class VideoStitcher:
         
         found_clips = []
         missing_words = []
-        used_video_ids = []  # Track videos we've already used
+        used_video_ids = set()  # Track videos we've already used (O(1) membership)
+        real_clip_count = 0
         i = 0
-        
-        while i < len(words):
+
+        # Hoist attribute chains out of the hot loop; these don't change
+        # during a lookup and LOAD_ATTR adds up over long scripts
+        channel_id = self.config.channel_id
+        pad_start = self.config.clip_padding_start
+        pad_end = self.config.clip_padding_end
+        max_phrase_length = self.config.max_phrase_length
+        has_transcripts = self.database.has_transcripts
+        has_phrase_index = self.database.has_phrase_index
+        find_phrase = self.database.find_phrase_in_transcripts
+        filter_indexed = self.database.filter_indexed_phrases
+        get_clip = self.database.get_clip_info
+        num_words = len(words)
+
+        while i < num_words:
             # Try to find longest phrase starting at position i
             best_clip = None
             best_length = 0
             
             # Only try phrase matching if transcripts are available
-            if self.database.has_transcripts:
+            if has_transcripts:
                 # Try phrases from longest to shortest (using configured max_phrase_length)
-                max_phrase_len = min(self.config.max_phrase_length, len(words) - i)
+                max_phrase_len = min(max_phrase_length, num_words - i)
+                # Build every candidate phrase for this position in one
+                # ascending pass; re-joining the slice per length is O(n^2)
+                # in characters
+                phrases = []
+                phrase = words[i]
+                for j in range(i + 1, i + max_phrase_len):
+                    phrase = phrase + ' ' + words[j]
+                    phrases.append(phrase)
+                # One batched hash probe covers every candidate length,
+                # so known index misses skip their per-phrase index query
+                # and go straight to the transcript-scan fallback
+                indexed = filter_indexed(phrases) if has_phrase_index else ()
                 for phrase_len in range(max_phrase_len, 1, -1):  # Start from longest
-                    phrase = ' '.join(words[i:i + phrase_len])
-                    clip_info = self.database.find_phrase_in_transcripts(
-                        phrase, 
-                        exclude_video_ids=used_video_ids,
-                        channel_id=self.config.channel_id,
-                        padding_start=self.config.clip_padding_start,
-                        padding_end=self.config.clip_padding_end
+                    phrase = phrases[phrase_len - 2]
+                    clip_info = find_phrase(
+                        phrase,
+                        exclude_video_ids=list(used_video_ids),
+                        channel_id=channel_id,
+                        padding_start=pad_start,
+                        padding_end=pad_end,
+                        check_index=phrase in indexed
                     )
                     
                     if clip_info is not None:
@@ -160,15 +281,16 @@ class VideoStitcher:
             # If phrase matching succeeded, use it
             if best_clip is not None:
                 found_clips.append(best_clip)
-                used_video_ids.append(best_clip.video_id)
+                used_video_ids.add(best_clip.video_id)
+                real_clip_count += 1
                 i += best_length
             else:
                 # Fall back to single word lookup
                 word = words[i]
-                clip_info = self.database.get_clip_info(
-                    word, 
-                    exclude_video_ids=used_video_ids,
-                    channel_id=self.config.channel_id
+                clip_info = get_clip(
+                    word,
+                    exclude_video_ids=list(used_video_ids),
+                    channel_id=channel_id
                 )
                 
                 if clip_info is None:
@@ -184,20 +306,20 @@ class VideoStitcher:
                     found_clips.append(placeholder)
                 else:
                     found_clips.append(clip_info)
-                    used_video_ids.append(clip_info.video_id)
-                
+                    used_video_ids.add(clip_info.video_id)
+                    real_clip_count += 1
+
                 i += 1
-        
-        # Log video diversity stats (excluding placeholders)
-        real_clips = [c for c in found_clips if c.video_id != "PLACEHOLDER"]
-        unique_videos = len(set(c.video_id for c in real_clips))
-        if unique_videos < len(real_clips):
-            logger.info(f"Video diversity: {unique_videos} unique videos used for {len(real_clips)} clips")
+
+        # Log video diversity stats (placeholders were never added to the set)
+        unique_videos = len(used_video_ids)
+        if unique_videos < real_clip_count:
+            logger.info(f"Video diversity: {unique_videos} unique videos used for {real_clip_count} clips")
         else:
             logger.info(f"Video diversity: All clips from different videos ({unique_videos} unique)")
-        
+
         logger.info(
-            f"Found {len(real_clips)} clips, {len(missing_words)} words using placeholders"
+            f"Found {real_clip_count} clips, {len(missing_words)} words using placeholders"
         )
         
         return found_clips, missing_words
@@ -218,8 +340,8 @@ class VideoStitcher:
             List of downloaded file paths in original order.
         """
         logger.info(f"Downloading {len(clips)} video segments (parallel)")
-        
-        downloaded_paths = [None] * len(clips)  # Preserve order
+
+        downloaded: dict = {}  # index -> path, only for successful downloads
         completed = 0
         
         def download_clip(index, clip):
@@ -231,53 +353,312 @@ class VideoStitcher:
                 logger.error(f"Failed to download clip for '{clip.word}': {e}")
                 return index, None, e
         
-        # Use ThreadPoolExecutor for parallel downloads if max_workers > 1
-        if self.config.max_workers > 1:
-            with ThreadPoolExecutor(max_workers=self.config.max_workers) as executor:
-                # Submit all download tasks
-                future_to_index = {
-                    executor.submit(download_clip, i, clip): i 
-                    for i, clip in enumerate(clips)
-                }
-                
-                # Collect results as they complete
-                for future in as_completed(future_to_index):
-                    completed += 1
-                    if progress_callback:
-                        progress_callback(completed, len(clips))
-                    
-                    index, path, error = future.result()
-                    if path is not None:
-                        downloaded_paths[index] = path
+        # Use the shared executor for parallel downloads if available
+        if self._executor is not None:
+            # Submit all download tasks
+            future_to_index = {
+                self._executor.submit(download_clip, i, clip): i
+                for i, clip in enumerate(clips)
+            }
+
+            # Collect results as they complete
+            for future in as_completed(future_to_index):
+                completed += 1
+                if progress_callback:
+                    progress_callback(completed, len(clips))
+
+                index, path, error = future.result()
+                if path is not None:
+                    downloaded[index] = path
         else:
             # Sequential download (for debugging or single-threaded mode)
             for i, clip in enumerate(clips):
                 completed += 1
                 if progress_callback:
                     progress_callback(completed, len(clips))
-                
+
                 index, path, error = download_clip(i, clip)
                 if path is not None:
-                    downloaded_paths[index] = path
-        
-        # Filter out failed downloads while preserving order
-        successful_paths = [p for p in downloaded_paths if p is not None]
-        
-        if len(successful_paths) < len(clips):
-            logger.warning(f"Only {len(successful_paths)}/{len(clips)} downloads succeeded")
+                    downloaded[index] = path
+
+        if len(downloaded) < len(clips):
+            logger.warning(f"Only {len(downloaded)}/{len(clips)} downloads succeeded")
             # Log which clips failed
-            for i, path in enumerate(downloaded_paths):
-                if path is None:
+            for i in range(len(clips)):
+                if i not in downloaded:
                     logger.warning(f"Failed to download clip {i}: {clips[i].word}")
-        
-        # Log the downloaded clips in order for debugging
-        logger.debug(f"Downloaded clips in order:")
-        for i, (clip, path) in enumerate(zip([c for c, p in zip(clips, downloaded_paths) if p is not None], successful_paths)):
-            logger.debug(f"  {i}: '{clip.word}' from {clip.video_id} -> {Path(path).name}")
-        
-        logger.info(f"Successfully downloaded {len(successful_paths)}/{len(clips)} segments")
-        return downloaded_paths  # Return full list with None values preserved for indexing
+
+        # Log the downloaded clips in order for debugging (skip the
+        # formatting entirely when debug logging is off)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Downloaded clips in order:")
+            for i in sorted(downloaded):
+                logger.debug(f"  {i}: '{clips[i].word}' from {clips[i].video_id} -> {os.path.basename(downloaded[i])}")
+
+        logger.info(f"Successfully downloaded {len(downloaded)}/{len(clips)} segments")
+        # Expand to a full positional list for callers that index by clip
+        return [downloaded.get(i) for i in range(len(clips))]
+
+    async def download_all_segments_async(
+        self,
+        clips: List[ClipInfo],
+        progress_callback: Optional[Callable] = None
+    ) -> List[str]:
+        """Async variant of download_all_segments for event-loop callers.
+
+        yt-dlp is a blocking library, so each download is delegated to a
+        worker thread via asyncio.to_thread with a semaphore capping
+        concurrency; the event loop itself never blocks on network I/O.
+
+        Args:
+            clips: List of clip information to download.
+            progress_callback: Optional callback function(current, total).
+
+        Returns:
+            List of downloaded file paths in original order.
+        """
+        semaphore = asyncio.Semaphore(self.config.max_workers)
+        downloaded: dict = {}
+        completed = 0
+
+        async def download_clip(index, clip):
+            async with semaphore:
+                try:
+                    return index, await asyncio.to_thread(
+                        self.downloader.download_segment, clip, clip_index=index
+                    )
+                except DownloadError as e:
+                    logger.error(f"Failed to download clip for '{clip.word}': {e}")
+                    return index, None
+
+        tasks = [
+            asyncio.create_task(download_clip(i, clip))
+            for i, clip in enumerate(clips)
+        ]
+        for task in asyncio.as_completed(tasks):
+            index, path = await task
+            completed += 1
+            if progress_callback:
+                progress_callback(completed, len(clips))
+            if path is not None:
+                downloaded[index] = path
+
+        logger.info(f"Successfully downloaded {len(downloaded)}/{len(clips)} segments")
+        return [downloaded.get(i) for i in range(len(clips))]
     
+    def _probe_duration(self, video_path: str, clip_info: Optional[ClipInfo]) -> float:
+        """Probe the actual duration of a processed segment.
+
+        Runs inside the worker so probes overlap with other segments
+        instead of happening serially during concatenation.
+        """
+        try:
+            props = self.processor.verify_video_properties(video_path)
+            return props.get('duration', clip_info.duration if clip_info else 0.0)
+        except Exception as e:
+            fallback = clip_info.duration if clip_info else 0.0
+            logger.warning(f"Could not get duration for {video_path}, using clip duration: {e}")
+            return fallback
+
+    def _process_segment(
+        self,
+        index: int,
+        segment_path: str,
+        clip_info: Optional[ClipInfo] = None
+    ) -> Tuple[int, Optional[str], Optional[float], Optional[Exception]]:
+        """Process a single segment and return its index, path and duration."""
+        processed_dir = self.temp_dir / "processed"
+        # Generate output path keyed on clip identity + processing options,
+        # so the cache hits even when the same clip lands in a different
+        # temp file between generations
+        # os.path avoids constructing a Path object per segment
+        original_name = os.path.splitext(os.path.basename(segment_path))[0]
+        if clip_info is not None:
+            cache_key = hashlib.blake2b(
+                repr((
+                    clip_info.video_id,
+                    clip_info.start_time,
+                    clip_info.duration,
+                    clip_info.word,
+                    self.config.normalize_audio,
+                    self.config.aspect_ratio,
+                    self.config.watermark_text,
+                    self.config.add_subtitles
+                )).encode(),
+                digest_size=16
+            ).hexdigest()
+            output_path = processed_dir / f"{cache_key}.mp4"
+        else:
+            output_path = processed_dir / f"{original_name}_processed.mp4"
+        # Check if already processed (cache)
+        if output_path.exists():
+            logger.debug(f"Using cached processed segment: {output_path.name}")
+            return (index, str(output_path), self._probe_duration(str(output_path), clip_info), None)
+
+        # Duplicate clips share a cache key, so two workers can both miss
+        # the exists() check above; each writes a private temp file and
+        # os.replace makes the cache fill atomic — whichever finishes last
+        # wins and nobody ever reads a half-written output
+        temp_path = output_path.with_name(
+            f"{output_path.stem}.{threading.get_ident()}.tmp.mp4"
+        )
+        try:
+            # Single fused ffmpeg pass: normalize + re-encode + resize +
+            # subtitle + watermark, writing the output directly
+            self.processor.process_all(
+                segment_path,
+                str(temp_path),
+                normalize_audio=self.config.normalize_audio,
+                aspect_ratio=self.config.aspect_ratio,
+                subtitle_text=clip_info.word if (self.config.add_subtitles and clip_info) else None,
+                watermark_text=self.config.watermark_text
+            )
+            os.replace(temp_path, output_path)
+
+            logger.debug(f"Processed segment: {output_path}")
+            return index, str(output_path), self._probe_duration(str(output_path), clip_info), None
+
+        except RuntimeError as e:
+            temp_path.unlink(missing_ok=True)
+            if "corrupted" in str(e).lower():
+                logger.warning(f"Skipping corrupted segment: {segment_path}")
+                return (index, None, None, e)
+            logger.error(f"Failed to process segment {segment_path}: {e}")
+            return index, None, None, e
+        except Exception as e:
+            temp_path.unlink(missing_ok=True)
+            logger.error(f"Failed to process segment {segment_path}: {e}")
+            return index, None, None, e
+
+    def pipeline_segments(
+        self,
+        clips: List[ClipInfo],
+        progress_callback: Optional[Callable] = None
+    ) -> List[Tuple[str, ClipInfo, float]]:
+        """Download and process segments concurrently through a bounded queue.
+
+        Downloads (and placeholder title cards) feed a bounded queue that
+        processing workers drain as segments land, so processing starts
+        before the last download finishes and peak temp-disk usage stays
+        proportional to the worker count rather than the clip count.
+        Source downloads are deleted as soon as their processed output
+        exists when cleanup_temp_files is enabled.
+
+        Args:
+            clips: List of clip information (placeholders included).
+            progress_callback: Optional callback function(current, total).
+
+        Returns:
+            List of (path, clip, duration) tuples in original order.
+        """
+        total = len(clips)
+        logger.info(f"Pipelining download and processing for {total} segments")
+
+        processed_dir = self.temp_dir / "processed"
+        processed_dir.mkdir(parents=True, exist_ok=True)
+        placeholder_dir = self.temp_dir / "placeholders"
+        placeholder_dir.mkdir(parents=True, exist_ok=True)
+        width, height = self.target_dimensions
+
+        # Bounded queue applies backpressure to downloads: producers block
+        # when processing falls behind, capping in-flight temp files
+        work_queue = queue.Queue(maxsize=2 * self.config.max_workers)
+        results = {}
+        lock = threading.Lock()
+        progress = {'completed': 0}
+        # Duplicate clips resolve to the same cached download, so queue
+        # items can share a source path; count references so cleanup only
+        # unlinks a source once its last consumer is done with it
+        source_refs = {}
+
+        def advance_progress():
+            with lock:
+                progress['completed'] += 1
+                current = progress['completed']
+            if progress_callback:
+                progress_callback(current, total)
+
+        def produce(index, clip):
+            """Download (or render) one segment and enqueue it for processing."""
+            try:
+                if clip.video_id == "PLACEHOLDER":
+                    placeholder_path = placeholder_dir / f"placeholder_{index}_{clip.word}.mp4"
+                    logger.info(f"Creating placeholder for word: {clip.word}")
+                    self.processor.create_title_card(
+                        str(placeholder_path),
+                        clip.word,
+                        duration=clip.duration,
+                        width=width,
+                        height=height,
+                        bg_color="gray",
+                        text_color="white"
+                    )
+                    work_queue.put((index, str(placeholder_path), clip, False))
+                else:
+                    path = self.downloader.download_segment(clip, clip_index=index)
+                    with lock:
+                        source_refs[path] = source_refs.get(path, 0) + 1
+                    work_queue.put((index, path, clip, True))
+            except Exception as e:
+                logger.error(f"Failed to produce segment for '{clip.word}': {e}")
+                advance_progress()
+
+        def consume():
+            """Process queued segments until the sentinel arrives."""
+            while True:
+                item = work_queue.get()
+                if item is None:
+                    work_queue.task_done()
+                    return
+                index, segment_path, clip, is_download = item
+                try:
+                    _, path, duration, error = self._process_segment(index, segment_path, clip)
+                    if is_download:
+                        with lock:
+                            source_refs[segment_path] -= 1
+                            last_ref = source_refs[segment_path] == 0
+                    if path is not None:
+                        with lock:
+                            results[index] = (path, clip, duration)
+                        # Drop the source download as soon as its last
+                        # reference is processed, keeping the disk
+                        # footprint bounded by the queue size
+                        if is_download and last_ref and self.config.cleanup_temp_files:
+                            try:
+                                os.unlink(segment_path)
+                            except OSError:
+                                pass
+                finally:
+                    advance_progress()
+                    work_queue.task_done()
+
+        # Producers run on the shared pool; consumers get dedicated threads
+        # so a full queue can never deadlock the pool against itself
+        consumers = [
+            threading.Thread(target=consume, daemon=True)
+            for _ in range(self.config.max_workers)
+        ]
+        for thread in consumers:
+            thread.start()
+
+        producer_futures = [
+            self._executor.submit(produce, i, clip)
+            for i, clip in enumerate(clips)
+        ]
+        for future in as_completed(producer_futures):
+            future.result()
+
+        for _ in consumers:
+            work_queue.put(None)
+        for thread in consumers:
+            thread.join()
+
+        successful_results = [results[i] for i in sorted(results)]
+        if len(successful_results) < total:
+            logger.warning(f"Only {len(successful_results)}/{total} segments completed the pipeline")
+        logger.info(f"Pipeline completed {len(successful_results)}/{total} segments")
+        return successful_results
+
     def process_segments(
         self,
         segment_paths: List[str],
@@ -292,127 +673,34 @@ class VideoStitcher:
             progress_callback: Optional callback function(current, total).
             
         Returns:
-            List of processed file paths in original order.
+            List of (path, clip, duration) tuples in original order.
         """
         logger.info(f"Processing {len(segment_paths)} video segments (parallel)")
-        
+
         # Create processed subdirectory
         processed_dir = self.temp_dir / "processed"
         processed_dir.mkdir(parents=True, exist_ok=True)
-        
-        processed_paths = [None] * len(segment_paths)  # Preserve order
+
+        processed: dict = {}  # index -> (path, duration), successes only
         completed = 0
-        
-        def process_segment(index, segment_path, clip_info=None):
-            """Process a single segment and return its index and path."""
-            # Generate output path
-            original_name = Path(segment_path).stem
-            output_path = processed_dir / f"{original_name}_processed.mp4"
-            segment_name = clip_info.word if clip_info else Path(segment_path).name
-            
-            # Check if already processed (cache)
-            if output_path.exists():
-                logger.debug(f"Using cached processed segment: {output_path.name}")
-                return (index, str(output_path), None)
-            
-            try:
-                current_path = segment_path
-                
-                # Step 1: Normalize audio if configured
-                if self.config.normalize_audio:
-                    temp_normalized = processed_dir / f"{original_name}_normalized.mp4"
-                    try:
-                        self.processor.normalize_audio(current_path, str(temp_normalized))
-                        current_path = str(temp_normalized)
-                    except RuntimeError as e:
-                        if "corrupted" in str(e).lower():
-                            logger.warning(f"Skipping corrupted segment: {segment_path}")
-                            return (index, None, e)
-                        raise
-                
-                # Step 2: Re-encode for consistency
-                temp_reencoded = processed_dir / f"{original_name}_reencoded.mp4"
-                try:
-                    self.processor.reencode_for_concat(current_path, str(temp_reencoded))
-                    # Validate the re-encoded file
-                    if not temp_reencoded.exists() or temp_reencoded.stat().st_size < 1000:
-                        raise RuntimeError(f"Re-encoded file is invalid: {temp_reencoded}")
-                    current_path = str(temp_reencoded)
-                except Exception as e:
-                    logger.error(f"Failed to re-encode segment {segment_path}: {e}")
-                    return (index, None, e)
-                
-                # Step 3: Resize to aspect ratio if needed
-                if self.config.aspect_ratio != "16:9":
-                    temp_resized = processed_dir / f"{original_name}_resized.mp4"
-                    self.processor.resize_to_aspect_ratio(
-                        current_path,
-                        str(temp_resized),
-                        self.config.aspect_ratio
-                    )
-                    current_path = str(temp_resized)
-                
-                # Step 4: Add subtitles if configured
-                if self.config.add_subtitles and clip_info:
-                    temp_subtitled = processed_dir / f"{original_name}_subtitled.mp4"
-                    self.processor.add_subtitle_overlay(
-                        current_path,
-                        str(temp_subtitled),
-                        clip_info.word
-                    )
-                    current_path = str(temp_subtitled)
-                
-                # Step 5: Add watermark if configured
-                if self.config.watermark_text:
-                    temp_watermarked = processed_dir / f"{original_name}_watermarked.mp4"
-                    self.processor.add_watermark(
-                        current_path,
-                        str(temp_watermarked),
-                        self.config.watermark_text
-                    )
-                    current_path = str(temp_watermarked)
-                
-                # Move final result to output path
-                if current_path != str(output_path):
-                    import shutil
-                    shutil.move(current_path, str(output_path))
-                
-                # Clean up temporary files
-                for temp_file in [
-                    processed_dir / f"{original_name}_normalized.mp4",
-                    processed_dir / f"{original_name}_reencoded.mp4",
-                    processed_dir / f"{original_name}_resized.mp4",
-                    processed_dir / f"{original_name}_subtitled.mp4",
-                    processed_dir / f"{original_name}_watermarked.mp4"
-                ]:
-                    if temp_file.exists() and temp_file != output_path:
-                        temp_file.unlink()
-                
-                logger.debug(f"Processed segment: {output_path}")
-                return index, str(output_path), None
-                
-            except Exception as e:
-                logger.error(f"Failed to process segment {segment_path}: {e}")
-                return index, None, e
-        
-        # Use ThreadPoolExecutor for parallel processing if max_workers > 1
-        if self.config.max_workers > 1:
-            with ThreadPoolExecutor(max_workers=self.config.max_workers) as executor:
-                # Submit all processing tasks
-                future_to_index = {
-                    executor.submit(process_segment, i, path, clips[i] if i < len(clips) else None): i 
-                    for i, path in enumerate(segment_paths)
-                }
-                
-                # Collect results as they complete
-                for future in as_completed(future_to_index):
-                    completed += 1
-                    if progress_callback:
-                        progress_callback(completed, len(segment_paths))
-                    
-                    index, path, error = future.result()
-                    if path is not None:
-                        processed_paths[index] = path
+
+        # Use the shared executor for parallel processing if available
+        if self._executor is not None:
+            # Submit all processing tasks
+            future_to_index = {
+                self._executor.submit(self._process_segment, i, path, clips[i] if i < len(clips) else None): i
+                for i, path in enumerate(segment_paths)
+            }
+
+            # Collect results as they complete
+            for future in as_completed(future_to_index):
+                completed += 1
+                if progress_callback:
+                    progress_callback(completed, len(segment_paths))
+
+                index, path, duration, error = future.result()
+                if path is not None:
+                    processed[index] = (path, duration)
         else:
             # Sequential processing (for debugging or single-threaded mode)
             for i, path in enumerate(segment_paths):
@@ -421,22 +709,22 @@ class VideoStitcher:
                     progress_callback(completed, len(segment_paths))
                 
                 clip_info_item = clips[i] if i < len(clips) else None
-                index, processed_path, error = process_segment(i, path, clip_info_item)
+                index, processed_path, duration, error = self._process_segment(i, path, clip_info_item)
                 if processed_path is not None:
-                    processed_paths[index] = processed_path
-        
-        # Filter out failed processing while preserving order and clip association
-        # Return tuples of (path, clip) for successful segments only
-        successful_results = []
-        for i, path in enumerate(processed_paths):
-            if path is not None and i < len(clips):
-                successful_results.append((path, clips[i]))
+                    processed[index] = (processed_path, duration)
+
+        # Order successful results and re-associate them with their clips
+        successful_results = [
+            (processed[i][0], clips[i], processed[i][1])
+            for i in sorted(processed) if i < len(clips)
+        ]
         
         if len(successful_results) < len(segment_paths):
             logger.warning(f"Only {len(successful_results)}/{len(segment_paths)} segments processed successfully")
         
         # Log the order of processed files for debugging
-        logger.debug(f"Processed files in order: {[Path(p).name for p, _ in successful_results]}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Processed files in order: {[os.path.basename(p) for p, _, _ in successful_results]}")
         
         logger.info(
             f"Successfully processed {len(successful_results)}/{len(segment_paths)} segments"
@@ -502,52 +790,66 @@ class VideoStitcher:
                     f"Using placeholders for {len(missing_words)} words: {', '.join(missing_words)}"
                 )
             
-            # Step 3: Download segments
-            phase_start = time.time()
-            logger.info("Step 3/5: Downloading video segments")
-            segments = self.download_all_segments(clips, progress_callback)
-            phase_times['download'] = time.time() - phase_start
-            logger.info(f"✓ Download completed in {phase_times['download']:.2f}s")
-            
-            # Create placeholder videos for missing words
-            placeholder_dir = self.temp_dir / "placeholders"
-            placeholder_dir.mkdir(parents=True, exist_ok=True)
-            width, height = self._get_target_dimensions()
-            
-            for i, clip in enumerate(clips):
-                if clip.video_id == "PLACEHOLDER":
-                    placeholder_path = placeholder_dir / f"placeholder_{i}_{clip.word}.mp4"
-                    logger.info(f"Creating placeholder for word: {clip.word}")
-                    self.processor.create_title_card(
-                        str(placeholder_path),
-                        clip.word,
-                        duration=clip.duration,
-                        width=width,
-                        height=height,
-                        bg_color="gray",
-                        text_color="white"
-                    )
-                    segments[i] = str(placeholder_path)
-            
-            # Verify we have at least some segments (either downloaded or placeholders)
-            if not any(seg is not None for seg in segments):
-                raise RuntimeError("Failed to download or create any video segments")
-            
-            # Filter segments and clips to only include non-None segments
-            valid_segments = []
-            valid_clips = []
-            for i, seg in enumerate(segments):
-                if seg is not None:
-                    valid_segments.append(seg)
-                    valid_clips.append(clips[i] if i < len(clips) else None)
-            
-            # Step 4: Process segments
-            phase_start = time.time()
-            logger.info("Step 4/5: Processing video segments")
-            processed_results = self.process_segments(valid_segments, valid_clips, progress_callback)
-            phase_times['process'] = time.time() - phase_start
-            logger.info(f"✓ Processing completed in {phase_times['process']:.2f}s")
-            
+            # Resolve target dimensions once; reused for placeholders and
+            # the intro/outro cards below
+            width, height = self.target_dimensions
+
+            if self._executor is not None:
+                # Steps 3-4 pipelined: processing consumes downloads as they
+                # land through a bounded queue instead of waiting for the
+                # whole download phase to finish
+                phase_start = time.time()
+                logger.info("Steps 3-4/5: Downloading and processing segments (pipelined)")
+                processed_results = self.pipeline_segments(clips, progress_callback)
+                phase_times['download'] = time.time() - phase_start
+                phase_times['process'] = 0.0
+                logger.info(f"✓ Download+processing completed in {phase_times['download']:.2f}s")
+            else:
+                # Step 3: Download segments
+                phase_start = time.time()
+                logger.info("Step 3/5: Downloading video segments")
+                segments = self.download_all_segments(clips, progress_callback)
+                phase_times['download'] = time.time() - phase_start
+                logger.info(f"✓ Download completed in {phase_times['download']:.2f}s")
+
+                # Create placeholder videos for missing words
+                placeholder_dir = self.temp_dir / "placeholders"
+                placeholder_dir.mkdir(parents=True, exist_ok=True)
+
+                for i, clip in enumerate(clips):
+                    if clip.video_id == "PLACEHOLDER":
+                        placeholder_path = placeholder_dir / f"placeholder_{i}_{clip.word}.mp4"
+                        logger.info(f"Creating placeholder for word: {clip.word}")
+                        self.processor.create_title_card(
+                            str(placeholder_path),
+                            clip.word,
+                            duration=clip.duration,
+                            width=width,
+                            height=height,
+                            bg_color="gray",
+                            text_color="white"
+                        )
+                        segments[i] = str(placeholder_path)
+
+                # Verify we have at least some segments (either downloaded or placeholders)
+                if not any(seg is not None for seg in segments):
+                    raise RuntimeError("Failed to download or create any video segments")
+
+                # Filter segments and clips to only include non-None segments
+                valid_segments = []
+                valid_clips = []
+                for i, seg in enumerate(segments):
+                    if seg is not None:
+                        valid_segments.append(seg)
+                        valid_clips.append(clips[i] if i < len(clips) else None)
+
+                # Step 4: Process segments
+                phase_start = time.time()
+                logger.info("Step 4/5: Processing video segments")
+                processed_results = self.process_segments(valid_segments, valid_clips, progress_callback)
+                phase_times['process'] = time.time() - phase_start
+                logger.info(f"✓ Processing completed in {phase_times['process']:.2f}s")
+
             if not processed_results:
                 raise RuntimeError("Failed to process any video segments")
             
@@ -567,8 +869,6 @@ class VideoStitcher:
             # Add intro card if configured
             if self.config.intro_text:
                 intro_path = self.temp_dir / "intro_card.mp4"
-                # Get dimensions from first video segment
-                width, height = self._get_target_dimensions()
                 self.processor.create_title_card(
                     str(intro_path),
                     self.config.intro_text,
@@ -580,19 +880,12 @@ class VideoStitcher:
                 current_timestamp += 2.0  # Intro card is 2 seconds
             
             # Add processed segments in order and track timings
-            # processed_results is a list of (video_path, clip) tuples
-            # This ensures word timings only include clips that made it into the final video
-            for video_path, clip in processed_results:
+            # processed_results is a list of (video_path, clip, duration) tuples
+            # Durations were probed during processing so no per-segment
+            # ffprobe calls are needed here
+            for video_path, clip, clip_duration in processed_results:
                 all_videos.append(video_path)
-                
-                # Get actual video duration from the processed file
-                try:
-                    props = self.processor.verify_video_properties(video_path)
-                    clip_duration = props.get('duration', clip.duration)
-                except Exception as e:
-                    logger.warning(f"Could not get duration for {video_path}, using clip duration: {e}")
-                    clip_duration = clip.duration
-                
+
                 # Record word timing only for clips that made it into final video
                 word_timings.append({
                     "word": clip.word,
@@ -605,7 +898,6 @@ class VideoStitcher:
             # Add outro card if configured
             if self.config.outro_text:
                 outro_path = self.temp_dir / "outro_card.mp4"
-                width, height = self._get_target_dimensions()
                 self.processor.create_title_card(
                     str(outro_path),
                     self.config.outro_text,
@@ -620,7 +912,12 @@ class VideoStitcher:
             if self.config.incremental_stitching:
                 self.concatenator.concatenate_incremental(all_videos, str(output_path))
             else:
-                self.concatenator.concatenate_videos(all_videos, str(output_path))
+                # Processed segments all share codec parameters after the
+                # fused re-encode, so stream copy is safe (the concatenator
+                # verifies and falls back to re-encoding otherwise)
+                self.concatenator.concatenate_videos(
+                    all_videos, str(output_path), stream_copy=True
+                )
             phase_times['concatenate'] = time.time() - phase_start
             logger.info(f"✓ Concatenation completed in {phase_times['concatenate']:.2f}s")
             
@@ -661,18 +958,19 @@ class VideoStitcher:
                             shutil.copy2(str(output_path), str(comparison_path))
                             logger.info(f"Original audio version saved: {comparison_path}")
                         
-                        # Replace video with enhanced audio version
-                        temp_output = self.temp_dir / f"{output_path.name}.tmp.mp4"
+                        # Replace video with enhanced audio version. The temp
+                        # file lives next to the final output so the swap is
+                        # an atomic same-filesystem rename, not a copy
+                        temp_output = self.output_dir / f"{output_path.name}.tmp.mp4"
                         self.processor.merge_audio_video(
                             str(output_path),
                             str(enhanced_audio_path),
                             str(temp_output),
                             keep_original_audio=False
                         )
-                        
+
                         # Replace original with enhanced version
-                        import shutil
-                        shutil.move(str(temp_output), str(output_path))
+                        os.replace(str(temp_output), str(output_path))
                         
                         logger.info(f"✓ Audio enhancement completed")
                         
@@ -727,37 +1025,38 @@ class VideoStitcher:
                 logger.info("Cleaning up temporary files")
                 try:
                     self.concatenator.cleanup()
-                    
-                    # Clean up downloaded and processed files
-                    import shutil
+
+                    # Clean up downloaded and processed files; the two
+                    # roots are disjoint so their deletions can overlap
                     downloads_dir = self.temp_dir / "downloads"
-                    if downloads_dir.exists():
-                        shutil.rmtree(downloads_dir, ignore_errors=True)
-                    
                     processed_dir = self.temp_dir / "processed"
-                    if processed_dir.exists():
-                        shutil.rmtree(processed_dir, ignore_errors=True)
-                    
+                    with ThreadPoolExecutor(max_workers=2) as cleanup_pool:
+                        cleanup_pool.map(_fast_rmtree, [downloads_dir, processed_dir])
+
                 except Exception as e:
                     logger.warning(f"Cleanup failed: {e}")
     
-    def _get_target_dimensions(self) -> Tuple[int, int]:
-        """Get target video dimensions based on aspect ratio configuration.
-        
+    @functools.cached_property
+    def target_dimensions(self) -> Tuple[int, int]:
+        """Target video dimensions based on aspect ratio configuration.
+
+        Resolved once per instance (the aspect ratio is fixed at
+        construction time).
+
         Returns:
             Tuple of (width, height) in pixels.
         """
-        resolutions = {
-            "16:9": (1920, 1080),
-            "9:16": (1080, 1920),
-            "1:1": (1080, 1080)
-        }
-        return resolutions.get(self.config.aspect_ratio, (1920, 1080))
+        return _TARGET_DIMENSIONS.get(self.config.aspect_ratio, (1920, 1080))
     
     def close(self) -> None:
         """Close the video stitcher and release resources."""
-        if hasattr(self, 'database'):
-            self.database.close()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        if self.database is not None:
+            if getattr(self, '_owns_database', True):
+                self.database.close()
+            self.database = None
         logger.info("VideoStitcher closed")
     
     def __enter__(self):
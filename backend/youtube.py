@@ -1,40 +1,113 @@
+import asyncio
+import json
 import os
 import httpx
-from typing import List, Dict
+from dataclasses import dataclass
+from typing import List
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 API_KEY = os.getenv("YOUTUBE_API_KEY")
 BASE = "https://www.googleapis.com/youtube/v3"
 
+
+def _decode_json(response: httpx.Response) -> dict:
+    """Decode a JSON response body, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return json.loads(response.content)
+
+
+@dataclass(slots=True, frozen=True)
+class VideoItem:
+    """One playlist entry; slots keep per-item memory at fixed offsets
+    instead of a dict per record."""
+    video_id: str
+    title: str
+    channel_id: str
+    channel_title: str
+    published_at: str | None
+
+# Shared client so repeated API calls reuse the pooled TLS connection
+# instead of paying a TCP+TLS handshake per call
+_CLIENT: httpx.AsyncClient | None = None
+_CLIENT_LOCK = asyncio.Lock()
+
+async def _get_client() -> httpx.AsyncClient:
+    global _CLIENT
+    if _CLIENT is None:
+        async with _CLIENT_LOCK:
+            if _CLIENT is None:
+                _CLIENT = httpx.AsyncClient(
+                    timeout=30,
+                    limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+                )
+    return _CLIENT
+
+async def aclose() -> None:
+    """Close the pooled client (call from app shutdown)."""
+    global _CLIENT
+    if _CLIENT is not None:
+        await _CLIENT.aclose()
+        _CLIENT = None
+
 async def list_uploads_playlist_id(channel_id: str) -> str:
     url = f"{BASE}/channels"
     params = {"part":"contentDetails", "id": channel_id, "key": API_KEY}
-    async with httpx.AsyncClient(timeout=30) as client:
-        r = await client.get(url, params=params)
-        r.raise_for_status()
-        items = r.json().get("items", [])
-        if not items: return ""
-        return items[0]["contentDetails"]["relatedPlaylists"]["uploads"]
+    client = await _get_client()
+    r = await client.get(url, params=params)
+    r.raise_for_status()
+    items = _decode_json(r).get("items", [])
+    if not items: return ""
+    return items[0]["contentDetails"]["relatedPlaylists"]["uploads"]
 
-async def list_videos_in_playlist(playlist_id: str, max_pages=3) -> List[Dict]:
+async def _fetch_video_metadata(client: httpx.AsyncClient, video_ids: List[str]) -> List[VideoItem]:
+    """One videos.list call for up to 50 ids (1 quota unit per batch)."""
+    url = f"{BASE}/videos"
+    params = {"part": "snippet", "id": ",".join(video_ids), "key": API_KEY}
+    r = await client.get(url, params=params)
+    r.raise_for_status()
+    return [VideoItem(
+        video_id=it["id"],
+        title=it["snippet"]["title"],
+        channel_id=it["snippet"]["channelId"],
+        channel_title=it["snippet"]["channelTitle"],
+        published_at=it["snippet"].get("publishedAt")
+    ) for it in _decode_json(r).get("items", []) if it.get("snippet")]
+
+async def list_videos_in_playlist(playlist_id: str, max_pages=3) -> List[VideoItem]:
     url = f"{BASE}/playlistItems"
-    params = {"part":"snippet,contentDetails", "playlistId": playlist_id, "maxResults":50, "key": API_KEY}
-    out = []
-    async with httpx.AsyncClient(timeout=30) as client:
-        page = 0
-        while True:
-            page += 1
-            r = await client.get(url, params=params)
-            r.raise_for_status()
-            data = r.json()
-            out.extend(data.get("items", []))
-            nxt = data.get("nextPageToken")
-            if not nxt or page >= max_pages: break
-            params["pageToken"] = nxt
-    return [{
-        "video_id": it["contentDetails"]["videoId"],
-        "title": it["snippet"]["title"],
-        "channel_id": it["snippet"]["channelId"],
-        "channel_title": it["snippet"]["channelTitle"],
-        "published_at": it["contentDetails"].get("videoPublishedAt")
-    } for it in out if it.get("contentDetails")]
+    # contentDetails-only pages cost 1 quota unit instead of 3 with
+    # snippet; metadata comes from batched videos.list calls below
+    params = {"part":"contentDetails", "playlistId": playlist_id, "maxResults":50, "key": API_KEY}
+    video_ids = []
+    client = await _get_client()
+    # Page tokens are only known sequentially, but the next fetch can be
+    # scheduled the moment a token is parsed so processing of page N
+    # overlaps the network wait for page N+1
+    next_task = asyncio.ensure_future(client.get(url, params=dict(params)))
+    for page in range(1, max_pages + 1):
+        r = await next_task
+        next_task = None
+        r.raise_for_status()
+        data = _decode_json(r)
+        nxt = data.get("nextPageToken")
+        if nxt and page < max_pages:
+            next_task = asyncio.ensure_future(
+                client.get(url, params={**params, "pageToken": nxt})
+            )
+        video_ids.extend(
+            it["contentDetails"]["videoId"]
+            for it in data.get("items", []) if it.get("contentDetails")
+        )
+        if next_task is None: break
+    if not video_ids:
+        return []
+    # 50 ids per videos.list request, batches fetched concurrently
+    batches = [video_ids[i:i + 50] for i in range(0, len(video_ids), 50)]
+    results = await asyncio.gather(*(_fetch_video_metadata(client, b) for b in batches))
+    return [item for batch in results for item in batch]
 